@@ -31,6 +31,7 @@ def test_utils_import():
         import twsc.utils.log
         import twsc.utils.cache_utils
         import twsc.utils.market_utils
+        import twsc.utils.rate_limiter
         assert True
     except ImportError as e:
         pytest.fail(f"Failed to import twsc utils: {e}")
@@ -0,0 +1,143 @@
+"""Tests for the partitioned Parquet cache in twsc.cache."""
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import twsc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from twsc.cache import CacheHandler
+
+
+def _bars(start, periods, freq="1D"):
+    """Build a small bar DataFrame indexed by UTC timestamps."""
+    index = pd.date_range(start, periods=periods, freq=freq, tz="UTC", name="timestamp")
+    return pd.DataFrame({
+        "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5,
+        "volume": 100, "wap": 1.2, "bar_count": 10,
+    }, index=index)
+
+
+def _handler(tmp_path):
+    return CacheHandler(None, symbol="TEST", bar_size="1 day", cache_dir=str(tmp_path))
+
+
+def test_save_writes_monthly_partitions(tmp_path):
+    """Test that saved data is split into one file per month and loads back merged."""
+    handler = _handler(tmp_path)
+    handler.save(_bars("2025-01-28", 7))  # Jan 28 .. Feb 3
+    assert handler.cache_path.is_dir()
+    assert [p.name for p in sorted(handler.cache_path.iterdir())] == ["2025-01.parquet", "2025-02.parquet"]
+
+    # Overlapping save replaces bars and only adds the new month
+    handler.save(_bars("2025-02-02", 30))
+    loaded = _handler(tmp_path).load()
+    assert len(loaded) == 5 + 30
+    assert loaded.index.is_monotonic_increasing and loaded.index.is_unique
+    assert (handler.cache_path / "2025-03.parquet").is_file()
+
+
+def test_save_migrates_legacy_file(tmp_path):
+    """Test that a legacy single-file cache is converted to partitions."""
+    handler = _handler(tmp_path)
+    _bars("2025-01-28", 7).to_parquet(handler.cache_path)
+
+    handler.save(_bars("2025-02-04", 2))
+    assert handler.cache_path.is_dir()
+    assert len(_handler(tmp_path).load()) == 9
+    assert sorted(p.name for p in handler.cache_path.parent.iterdir()) == [handler.cache_path.name]
+
+
+def test_failed_migration_keeps_legacy_file(tmp_path, monkeypatch):
+    """Test that a failing partition write leaves the legacy cache untouched."""
+    handler = _handler(tmp_path)
+    _bars("2025-01-28", 7).to_parquet(handler.cache_path)
+
+    original = CacheHandler._write_partition
+    calls = []
+
+    def failing_write(self, data, key, directory=None):
+        calls.append(key)
+        if len(calls) > 1:
+            raise OSError("disk full")
+        original(self, data, key, directory)
+
+    monkeypatch.setattr(CacheHandler, "_write_partition", failing_write)
+    with pytest.raises(RuntimeError):
+        handler.save(_bars("2025-02-04", 2))
+
+    assert handler.cache_path.is_file()
+    assert len(pd.read_parquet(handler.cache_path)) == 7
+    assert sorted(p.name for p in handler.cache_path.parent.iterdir()) == [handler.cache_path.name]
+
+
+def test_check_coverage_parses_timezone_suffixed_end_time(tmp_path):
+    """Test that a "YYYYMMDD HH:MM:SS <tz>" end time is parsed rather than treated as now."""
+    from twsc.utils.cache_utils import get_cache_expected_range
+
+    end = "20250715 12:00:00 US/Eastern"
+    ranges = [
+        get_cache_expected_range("5 mins", end, "1 D", "US/Eastern", current_time=pd.Timestamp(now, tz="UTC"))
+        for now in ("2025-07-15 16:00", "2026-03-02 18:30")
+    ]
+    assert ranges[0] == ranges[1]
+    assert ranges[0][1] == pd.Timestamp("2025-07-15 12:00", tz="US/Eastern")
+
+    handler = CacheHandler(None, symbol="TEST", bar_size="5 mins", cache_dir=str(tmp_path))
+    handler.save(_bars("2025-07-15 13:30", 31, freq="5min"))  # 09:30 .. 12:00 ET
+    assert handler.check_coverage(end, "1 D", "US/Eastern")
+
+
+def test_load_window_and_columns_across_partitions(tmp_path):
+    """Test that a start/end window and column selection read only the matching rows across months."""
+    _handler(tmp_path).save(_bars("2025-01-20", 30))  # Jan 20 .. Feb 18
+
+    loaded = _handler(tmp_path).load(
+        columns=["close"],
+        start=pd.Timestamp("2025-01-30", tz="UTC"),
+        end=pd.Timestamp("2025-02-03", tz="UTC"),
+    )
+    assert list(loaded.columns) == ["close"]
+    assert list(loaded.index) == list(pd.date_range("2025-01-30", "2025-02-03", freq="1D", tz="UTC"))
+
+
+def test_load_naive_bounds_match_on_disk_and_memory_paths(tmp_path):
+    """Test that naive bounds are read as index-timezone times on both load paths."""
+    handler = _handler(tmp_path)
+    handler.save(_bars("2025-01-20", 30))
+    start, end = pd.Timestamp("2025-01-30"), pd.Timestamp("2025-02-03")
+
+    from_disk = _handler(tmp_path).load(start=start, end=end)
+    assert handler.load() is handler.data  # full load syncs the in-memory copy
+    from_memory = handler.load(start=start, end=end)
+    assert len(from_disk) == 5
+    pd.testing.assert_frame_equal(from_disk, from_memory, check_freq=False)
+
+    # Aware bounds in another timezone are converted, not compared wall-clock
+    shifted = handler.load(start=start.tz_localize("UTC").tz_convert("Asia/Tokyo"), end=end.tz_localize("UTC"))
+    pd.testing.assert_frame_equal(shifted, from_memory, check_freq=False)
+
+
+def test_load_serves_memory_until_cache_changes(tmp_path, monkeypatch):
+    """Test the mtime fast path: unchanged caches skip the Parquet read, new writes are picked up."""
+    import pyarrow.parquet as pq
+
+    handler = _handler(tmp_path)
+    handler.save(_bars("2025-01-20", 5))
+    handler.load()
+
+    reads = []
+    read_table = pq.read_table
+    monkeypatch.setattr(pq, "read_table", lambda *args, **kwargs: reads.append(args) or read_table(*args, **kwargs))
+    assert len(handler.load()) == 5
+    assert reads == []
+
+    other = _handler(tmp_path)
+    other.save(_bars("2025-03-01", 3))
+    reads.clear()
+    os.utime(handler.cache_path, ns=(0, handler._data_mtime + 1))  # coarse filesystem clocks
+    assert len(handler.load()) == 8
+    assert len(reads) == 1
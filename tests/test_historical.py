@@ -0,0 +1,97 @@
+"""Tests for the asyncio historical data requests in twsc.mixin.historical."""
+import asyncio
+import threading
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import twsc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("ibapi")
+pytest.importorskip("pyarrow")
+
+from ibapi.common import BarData
+
+from twsc.contract import Contract
+from twsc.mixin.historical import HistoricalDataMixin
+
+
+class _StubClient(HistoricalDataMixin):
+    """HistoricalDataMixin over a fake EClient that answers from its own thread."""
+
+    def __init__(self, respond=True):
+        super().__init__(timezone="UTC")
+        self.is_connected = True
+        self.respond = respond
+        self.requests = []
+        self.cancelled = []
+        self.reply_threads = []
+
+    def isConnected(self):
+        return True
+
+    def reqHistoricalData(self, reqId, **kwargs):
+        self.requests.append(reqId)
+        if self.respond:
+            thread = threading.Thread(target=self._reply, args=(reqId,))
+            self.reply_threads.append(thread)
+            thread.start()
+
+    def cancelHistoricalData(self, reqId):
+        self.cancelled.append(reqId)
+
+    def _reply(self, req_id):
+        # Runs like the API reader thread: bars, then historicalDataEnd
+        for i in range(3):
+            bar = BarData()
+            bar.date = f"20250715 09:3{i}:00 US/Eastern"
+            bar.open = bar.high = bar.low = bar.close = bar.wap = 100.0 + i
+            bar.volume = 10
+            bar.barCount = 1
+            self.historicalData(req_id, bar)
+        self.historicalDataEnd(req_id, "", "")
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path, monkeypatch):
+    # CacheHandler creates its default cache directory under the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def test_async_request_completes_from_api_thread():
+    """Test that historicalDataEnd on another thread resolves the awaiting request."""
+    client = _StubClient()
+
+    df = asyncio.run(client.get_historical_data_async(Contract(symbol="AAPL"), use_cache=False, timeout=5))
+
+    assert len(df) == 3
+    assert df["close"].tolist() == [100.0, 101.0, 102.0]
+    assert all(t is not threading.main_thread() for t in client.reply_threads)
+    assert client._callbacks == {}
+    assert client.cancelled == []
+
+
+def test_async_request_cancels_on_timeout():
+    """Test that an unanswered request is cancelled and its state dropped."""
+    client = _StubClient(respond=False)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(client.get_historical_data_async(Contract(symbol="AAPL"), use_cache=False, timeout=0.05))
+
+    assert client.cancelled == client.requests
+    req_id = client.requests[0]
+    assert req_id not in client.historical_data
+    assert req_id not in client._hist_events
+    assert client._callbacks == {}
+
+
+def test_many_requests_keep_contract_order():
+    """Test that concurrent requests return one frame per contract, in order."""
+    client = _StubClient()
+    contracts = [Contract(symbol=s) for s in ("AAPL", "MSFT", "NVDA")]
+
+    results = asyncio.run(client.get_historical_data_many(contracts, use_cache=False, timeout=5))
+
+    assert [len(df) for df in results] == [3, 3, 3]
+    assert len(set(client.requests)) == 3
@@ -0,0 +1,83 @@
+"""Tests for twsc.utils.market_utils."""
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add the parent directory to the path so we can import twsc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_get_calendar_info_includes_calendar_details():
+    """Test that calendar name and timezone are reported when exchange_calendars is available."""
+    pytest.importorskip("exchange_calendars")
+    from twsc.utils.market_utils import get_calendar_info
+
+    info = get_calendar_info("NYSE")
+    assert info["exchange"] == "NYSE"
+    assert info["calendar_code"] == "XNYS"
+    assert info["has_advanced_calendar"] is True
+    assert info["calendar_name"] == "XNYS"
+    assert info["calendar_tz"] == "America/New_York"
+
+
+def _scalar_results(func, timestamps, exchange):
+    return [func(ts, exchange) for ts in timestamps]
+
+
+@pytest.mark.parametrize("exchange", ["NYSE", "HKEX"])
+def test_is_market_open_array_matches_scalar(exchange):
+    """Test the vectorized market-open mask against the scalar check, including HKEX's lunch break."""
+    pytest.importorskip("exchange_calendars")
+    from twsc.utils.market_utils import is_market_open, is_market_open_array
+
+    tz = {"NYSE": "America/New_York", "HKEX": "Asia/Hong_Kong"}[exchange]
+    timestamps = pd.date_range("2025-07-03 08:00", "2025-07-07 17:00", freq="15min", tz=tz)
+    # Exact open / close / break instants of one session
+    timestamps = timestamps.append(pd.DatetimeIndex([
+        pd.Timestamp("2025-07-08 09:30", tz=tz),
+        pd.Timestamp("2025-07-08 12:00", tz=tz),
+        pd.Timestamp("2025-07-08 13:00", tz=tz),
+        pd.Timestamp("2025-07-08 16:00", tz=tz),
+    ]))
+
+    assert is_market_open_array(timestamps, exchange).tolist() == _scalar_results(is_market_open, timestamps, exchange)
+
+
+def test_is_market_open_array_naive_and_out_of_bounds_match_scalar():
+    """Test naive input (market timezone) and dates outside the calendar bounds against the scalar check."""
+    pytest.importorskip("exchange_calendars")
+    from twsc.utils.market_utils import is_market_open, is_market_open_array
+
+    naive = pd.date_range("2025-07-08 09:00", "2025-07-08 16:30", freq="30min")
+    assert is_market_open_array(naive, "NYSE").tolist() == _scalar_results(is_market_open, naive, "NYSE")
+
+    # Outside the calendar bounds both fall back to the basic hours check
+    old = pd.date_range("1990-03-02 09:00", "1990-03-05 16:30", freq="30min", tz="America/New_York")
+    assert is_market_open_array(old, "NYSE").tolist() == _scalar_results(is_market_open, old, "NYSE")
+
+
+def test_basic_market_open_array_matches_scalar():
+    """Test the basic (calendar-free) array check against its scalar counterpart, close instant included."""
+    from twsc.utils.market_utils import _is_market_open_basic, _is_market_open_basic_array, _resolve
+
+    for exchange in ("NYSE", "HKEX", "LSE"):
+        info = _resolve(exchange)
+        timestamps = pd.date_range("2025-07-04 00:00", "2025-07-07 23:45", freq="15min", tz="UTC")
+        close = pd.Timestamp(f"2025-07-07 {info.close}", tz=info.timezone)
+        timestamps = timestamps.append(pd.DatetimeIndex([close.tz_convert("UTC")]))
+        expected = [_is_market_open_basic(ts, info) for ts in timestamps]
+        assert _is_market_open_basic_array(timestamps, info).tolist() == expected
+
+
+def test_is_trading_day_array_matches_scalar():
+    """Test the vectorized trading-day mask against the scalar check, in and outside the calendar bounds."""
+    pytest.importorskip("exchange_calendars")
+    from twsc.utils.market_utils import is_trading_day, is_trading_day_array
+
+    for exchange in ("NYSE", "HKEX"):
+        dates = pd.date_range("2025-06-25", "2025-07-10", freq="D")
+        assert is_trading_day_array(dates, exchange).tolist() == _scalar_results(is_trading_day, dates, exchange)
+
+    old = pd.date_range("1990-03-01", "1990-03-10", freq="D")
+    assert is_trading_day_array(old, "NYSE").tolist() == _scalar_results(is_trading_day, old, "NYSE")
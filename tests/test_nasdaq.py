@@ -0,0 +1,99 @@
+"""Tests for the NASDAQ screener stock list in twsc.utils.stock_list.nasdaq."""
+import logging
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import twsc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+httpx = pytest.importorskip("httpx")
+pd = pytest.importorskip("pandas")
+
+from twsc.utils.stock_list import nasdaq
+
+
+def _row(symbol, lastsale="$5.20", volume="587836", market_cap="503,635,803.00"):
+    return {
+        "symbol": symbol, "name": symbol, "lastsale": lastsale, "netchange": "0.10", "pctchange": "1.5%",
+        "volume": volume, "marketCap": market_cap, "sector": "Finance", "industry": "Investment Managers",
+    }
+
+
+def _response(rows):
+    request = httpx.Request("GET", nasdaq._SCREENER_URL)
+    return httpx.Response(200, json={"data": {"rows": rows}}, request=request)
+
+
+def test_screener_frame_parses_numbers():
+    """Test that prices, percentages and counts are parsed and volume is a nullable integer."""
+    df = nasdaq._screener_response_to_frame(_response([_row("ABL"), _row("RKLB", volume="")]))
+
+    assert df["lastsale"].tolist() == [5.2, 5.2]
+    assert df["pctchange"].tolist() == pytest.approx([0.015, 0.015])
+    assert df["marketCap"].tolist() == [503635803.0, 503635803.0]
+    assert str(df["volume"].dtype) == "Int64"
+    assert df["volume"].iloc[0] == 587836 and df["volume"].isna().iloc[1]
+
+
+def test_screener_frame_logs_coerced_values(caplog):
+    """Test that malformed values become NaN with a warning, while blanks stay silent."""
+    rows = [_row("ABL", lastsale="N/A"), _row("RKLB", market_cap="")]
+
+    with caplog.at_level(logging.WARNING, logger=nasdaq.__name__):
+        df = nasdaq._screener_response_to_frame(_response(rows))
+
+    assert df["lastsale"].isna().tolist() == [True, False]
+    assert df["marketCap"].isna().tolist() == [False, True]
+    assert [r.getMessage() for r in caplog.records] == ["Coerced 1 malformed lastsale value(s) to NaN"]
+
+
+@pytest.fixture
+def screener(monkeypatch):
+    """Route the shared client to a mock transport and count the requests it answers."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": {"rows": [_row("ABL")]}})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(nasdaq, "_CLIENT", client)
+    nasdaq._fetch_screener.cache_clear()
+    yield requests
+    nasdaq._fetch_screener.cache_clear()
+    client.close()
+
+
+def test_use_cache_false_bypasses_cache(screener):
+    """Test that repeated cached calls hit the API once and use_cache=False always queries it."""
+    nasdaq.get_nasdaq_stocks_list()
+    nasdaq.get_nasdaq_stocks_list()
+    assert len(screener) == 1
+
+    nasdaq.get_nasdaq_stocks_list(use_cache=False)
+    assert len(screener) == 2
+    assert nasdaq._fetch_screener.cache_info().currsize == 1
+
+
+def test_cached_frame_cannot_be_mutated_by_callers(screener):
+    """Test that changing a returned frame leaves the cached result untouched."""
+    df = nasdaq.get_nasdaq_stocks_list()
+    df.loc[0, "lastsale"] = -1.0
+    df.drop(columns="volume", inplace=True)
+
+    again = nasdaq.get_nasdaq_stocks_list()
+    assert again.loc[0, "lastsale"] == 5.2
+    assert "volume" in again.columns
+    assert len(screener) == 1
+
+
+def test_cached_result_expires_after_ttl(screener, monkeypatch):
+    """Test that the cache is keyed on a time bucket, so quotes are refetched after the TTL."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(nasdaq.time, "time", lambda: now[0])
+
+    nasdaq.get_nasdaq_stocks_list()
+    now[0] += nasdaq._CACHE_TTL
+    nasdaq.get_nasdaq_stocks_list()
+    assert len(screener) == 2
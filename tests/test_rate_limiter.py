@@ -0,0 +1,90 @@
+"""Tests for the asyncio token bucket in twsc.utils.rate_limiter."""
+import asyncio
+import types
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import twsc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from twsc.utils import rate_limiter
+from twsc.utils.rate_limiter import RateLimiter
+
+
+class _FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._sleep = asyncio.sleep
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+        await self._sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_is_bounded_then_paced(clock):
+    """Test that up to rate calls pass at once and later ones are released every per/rate seconds."""
+    limiter = RateLimiter(rate=3, per=1.5)
+
+    async def acquire_all(n):
+        times = []
+        for _ in range(n):
+            await limiter.acquire()
+            times.append(clock.now)
+        return times
+
+    times = asyncio.run(acquire_all(6))
+    assert times == pytest.approx([0.0, 0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+def test_tokens_refill_while_idle(clock):
+    """Test that an idle limiter refills to at most rate tokens."""
+    limiter = RateLimiter(rate=2, per=1.0)
+
+    async def run():
+        for _ in range(2):
+            await limiter.acquire()
+        clock.now += 10.0  # idle far longer than one window
+        start = clock.now
+        for _ in range(3):
+            await limiter.acquire()
+        return clock.now - start
+
+    assert asyncio.run(run()) == pytest.approx(0.5)
+
+
+def test_concurrent_waiters_share_the_budget(clock):
+    """Test that concurrent acquirers are still limited to rate per window."""
+    limiter = RateLimiter(rate=2, per=1.0)
+    released = []
+
+    async def worker():
+        await limiter.acquire()
+        released.append(clock.now)
+
+    async def run():
+        await asyncio.gather(*(worker() for _ in range(5)))
+
+    asyncio.run(run())
+    assert released == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+def test_invalid_arguments():
+    """Test that a non-positive rate or window is rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(per=0)
@@ -5,19 +5,41 @@ This package provides a high-level, event-driven framework for building, backtes
 and deploying algorithmic trading strategies with Interactive Brokers.
 """
 
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "ibtrade Development Team"
 
 
-from .client import IBKRClient
-from .contract import Contract
+if TYPE_CHECKING:
+    from .client import IBKRClient
+    from .contract import Contract
 
-from .utils.log import setup_logging
+    from .utils.log import setup_logging
 
 
 __all__ = [
     "IBKRClient",
     "setup_logging",
-    
+
     "Contract"
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import public names on first access (PEP 562).
+
+    Keeps ``import twsc`` cheap: ibapi and pandas are only imported once a
+    name that needs them is used.
+    """
+    if name == "IBKRClient":
+        from .client import IBKRClient
+        return IBKRClient
+    if name == "Contract":
+        from .contract import Contract
+        return Contract
+    if name == "setup_logging":
+        from .utils.log import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
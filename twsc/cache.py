@@ -1,14 +1,85 @@
+import functools
 import logging
+import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
 
-import pandas as pd
+from .const import empty_data_frame
 
-from .const import DATA_COLUMNS
-from .utils.cache_utils import get_cache_expected_range, is_cache_sufficient
+# pandas, numpy and pyarrow are imported inside the methods that need them,
+# so importing this module stays cheap for code paths that never cache
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+# Cache directories already created (or found) by any handler in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+# bar_size -> cache subdirectory name, e.g. "5 mins" -> "5_mins"
+_SUBDIR_TABLE = str.maketrans({' ': '_', '/': '_'})
+
+
+@functools.lru_cache(maxsize=256)
+def _coverage_decision(
+    cached_start: 'pd.Timestamp',
+    cached_end: 'pd.Timestamp',
+    bar_size: str,
+    exchange: str,
+    end_date_time: str,
+    duration: str,
+    timezone: str,
+) -> bool:
+    """
+    Decide whether a cached time range covers a request.
+
+    Memoized because backtests re-check the same symbol and request many times.
+
+    Returns:
+        bool: True if the cached range covers the expected market hours
+    """
+    from .utils.cache_utils import get_cache_expected_range, is_cache_sufficient
+
+    expected_start, expected_end = get_cache_expected_range(
+        bar_size=bar_size,
+        end_date_time=end_date_time,
+        duration=duration,
+        timezone=timezone,
+        exchange=exchange
+    )
+    return is_cache_sufficient(
+        cached_start=cached_start,
+        cached_end=cached_end,
+        expected_start=expected_start,
+        expected_end=expected_end,
+        duration=duration,
+        bar_size=bar_size,
+        exchange=exchange
+    )
+
+
+def _as_index_tz(bound, tz) -> Optional['pd.Timestamp']:
+    """
+    Express a load bound in the timezone of the cache index.
+
+    Args:
+        bound: Timestamp (or anything pd.Timestamp accepts), or None
+        tz: Timezone of the index, or None for a naive index
+    Returns:
+        Optional[pd.Timestamp]: The bound, comparable with the index; None if not given
+    """
+    import pandas as pd
+
+    if bound is None:
+        return None
+    bound = pd.Timestamp(bound)
+    if bound.tz is None:
+        return bound.tz_localize(tz) if tz is not None else bound
+    return bound.tz_convert(tz) if tz is not None else bound.tz_convert('UTC').tz_localize(None)
+
 
 class CacheHandler:
     """
@@ -16,6 +87,9 @@ class CacheHandler:
     
     This class provides intelligent caching using Parquet files to minimize API calls
     and dramatically speed up repeated data requests.
+
+    Each cache is a directory holding one Parquet file per calendar month
+    (``YYYY-MM.parquet``), so a save only rewrites the months it touches.
     """
 
     def __init__(
@@ -40,7 +114,6 @@ class CacheHandler:
         """
         self.client = client
         self.cache_dir = Path(cache_dir)
-        self._ensure_cache_dir()
 
         self.symbol: str = symbol.upper()
         # TODO: validate bar_size against API documentation
@@ -50,9 +123,14 @@ class CacheHandler:
         self.currency: str = currency.upper()
         self.data_type: str = data_type.upper()
 
+        self._subdir: str = bar_size.lower().translate(_SUBDIR_TABLE)
         self.cache_path: Path = self._create_cache_path()
+        # Creates cache_dir as well
+        self._ensure_cache_dir(self._subdir)
 
-        self.data: pd.DataFrame = pd.DataFrame(columns=DATA_COLUMNS)  # Initialize empty DataFrame for data storage
+        self.data: Optional['pd.DataFrame'] = None  # Materialized on first load/save
+        # cache_path mtime (ns) when self.data was last synced with disk
+        self._data_mtime: Optional[int] = None
 
     def __str__(self) -> str:
         base = (f"CacheHandler(symbol={self.symbol}, bar_size={self.bar_size}, " +
@@ -69,123 +147,414 @@ class CacheHandler:
 
     def _create_cache_path(self) -> Path:
         """
-        Get the cache file path based on the current configuration.
-        Generate the cache file path based on the timeframe as subdirectory.
-        The cache file is named using a hash of the timeframe to ensure uniqueness.
+        Get the cache path based on the current configuration.
+        Generate the cache path based on the timeframe as subdirectory.
+        The path is a directory of monthly partition files; caches written by
+        older versions are a single Parquet file at the same path.
         
         Returns:
-            Path: Path to the cache file
+            Path: Path to the cache directory (or legacy cache file)
         """
-        # Normalize timeframe to create a unique cache file name
+        # Pure: no filesystem access, so the result is safe to use as a cache key
         filename = f"{self.symbol}_{self.exchange}_{self.what_to_show}_{self.currency}_{self.data_type}"
-        subdir = self.bar_size.lower().replace(" ", "_").replace("/", "_")
-        self._ensure_cache_dir(subdir)
-        return Path(self.cache_dir, subdir, f"{filename}.parquet")
+        return Path(self.cache_dir, self._subdir, f"{filename}.parquet")
 
 
     def _ensure_cache_dir(self, subdir: Optional[str] = None) -> None:
         """Create cache directory structure if it doesn't exist."""
-        
-        # if cache_dir it not exists, create it and show log message
-        if not self.cache_dir.exists():
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created cache directory: {self.cache_dir}")
+        path = self.cache_dir / subdir if subdir else self.cache_dir
 
-        if subdir:
-            subdir_path = self.cache_dir / subdir
-            if not subdir_path.exists():
-                subdir_path.mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Created cache subdirectory: {subdir_path}")
+        # Handlers for the same symbol universe share directories; only touch each once
+        if path in _ENSURED_DIRS:
+            return
 
+        # A single mkdir call both checks and creates; FileExistsError means it was already there
+        try:
+            path.mkdir(parents=True)
+            logger.info("Created cache directory: %s", path)
+        except FileExistsError:
+            pass
+        _ENSURED_DIRS.add(path)
 
-    def save(self, data: pd.DataFrame) -> Optional[pd.DataFrame]:
+
+    def save(self, data: 'pd.DataFrame') -> Optional['pd.DataFrame']:
         """
         Save data to smart cache using Parquet format.
+
+        The data is merged with the cached data, but only the monthly partitions
+        that contain incoming bars are rewritten on disk.
+
         Args:
-            symbol: The symbol for the data
-            timeframe: Timeframe for the data
-            exchange: Exchange for the data (optional)
-            currency: Currency for the data (optional)
-            data_type: Type of data (optional)
             data: DataFrame containing the data to save
+        Returns:
+            Optional[pd.DataFrame]: The merged cache data, or None if the data has no timestamps
         """
-        logger.debug(f"Saving data to cache: {self.cache_path}")
+        import numpy as np
+        import pandas as pd
+
+        logger.debug("Saving data to cache: %s", self.cache_path)
 
-        # Ensure incoming data has proper index
-        if 'timestamp' in data.columns and not isinstance(data.index, pd.DatetimeIndex):
+        # Ensure incoming data has proper index (usually it already has one)
+        if not isinstance(data.index, pd.DatetimeIndex):
+            if 'timestamp' not in data.columns:
+                logger.warning("Incoming data doesn't have timestamp column or datetime index.")
+                return None
             logger.debug("Setting timestamp as index on incoming data.")
             data = data.set_index('timestamp')
-        elif not isinstance(data.index, pd.DatetimeIndex):
-            logger.warning("Incoming data doesn't have timestamp column or datetime index.")
-            return
 
         # Load existing data
         existing_data = self.load()
+
+        # Collapse duplicate timestamps within the incoming batch, latest wins.
+        # On sorted input duplicates are adjacent, so an int64 diff finds them
+        # without hashing the index.
+        if not data.index.is_monotonic_increasing:
+            # Stable sort keeps the original order among equal timestamps
+            data = data.sort_index(kind='mergesort')
+        if len(data) > 1:
+            keep = np.empty(len(data), dtype=bool)
+            np.not_equal(data.index.asi8[1:], data.index.asi8[:-1], out=keep[:-1])
+            keep[-1] = True
+            if not keep.all():
+                data = data[keep]
+
+        # Keep the cached timezone so monthly partition boundaries stay stable
+        existing_tz = getattr(existing_data.index, 'tz', None)
+        if existing_tz is not None and data.index.tz is not None and str(existing_tz) != str(data.index.tz):
+            data = data.tz_convert(existing_tz)
         
-        # Combine data
+        # Combine data. Both sides are sorted and unique from here on, so the
+        # result is built in order and never needs a full sort_index().
+        if not existing_data.empty and not existing_data.index.is_monotonic_increasing:
+            existing_data = existing_data.sort_index()
         if existing_data.empty:
             logger.debug("No existing cache data - saving new data directly.")
-            new_data = data.copy()
+            # No copy needed: nothing below mutates it
+            new_data = data
+        elif data.index[0] > existing_data.index[-1]:
+            logger.debug("Appending newer bars to existing cache data.")
+            # Common case: nothing overlaps, so no deduplication is needed
+            new_data = pd.concat([existing_data, data])
         else:
-            logger.debug("Appending new data to existing cache data.")
-            # Both should now have datetime indices
-            new_data = pd.concat([existing_data, data]).drop_duplicates()
-            
-            # Additional deduplication by index (timestamp) to handle duplicate timestamps
-            new_data = new_data[~new_data.index.duplicated(keep='last')]
+            logger.debug("Merging overlapping data into existing cache data.")
+            # Incoming bars replace cached bars with the same timestamp
+            kept = existing_data[~existing_data.index.isin(data.index)]
+            new_data = pd.concat([kept, data])
+            # Two sorted runs: a stable sort on the int64 keys is a linear merge
+            order = np.argsort(new_data.index.asi8, kind='stable')
+            new_data = new_data.take(order)
 
         try:
-            # Sort by index (timestamp)
-            new_data = new_data.sort_index()
-
-            logger.debug(f"Saving data to cache at: {self.cache_path}")
-            # Save with index=True to preserve timestamp index
-            new_data.to_parquet(self.cache_path, index=True)
+            logger.debug("Saving data to cache at: %s", self.cache_path)
+            partition_keys = self._partition_keys(new_data.index)
+            if self.cache_path.is_file():
+                # Migrate a legacy single-file cache by writing every partition
+                touched_keys = np.unique(partition_keys)
+                self._migrate_legacy_cache(new_data, partition_keys, touched_keys)
+            else:
+                touched_keys = np.unique(self._partition_keys(data.index))
+                self.cache_path.mkdir(parents=True, exist_ok=True)
+                self._write_partitions(new_data, partition_keys, touched_keys, self.cache_path)
             
             # Update our internal data
             self.data = new_data
+            self._data_mtime = self._cache_mtime()
             
-            logger.info(f"Data saved to cache: {self.cache_path} with {len(new_data)} rows")
+            logger.info("Data saved to cache: %s with %d rows (%d partitions written)",
+                        self.cache_path, len(new_data), len(touched_keys))
         except Exception as e:
-            logger.error(f"Failed to save data to cache: {e}")
+            logger.error("Failed to save data to cache: %s", e)
             raise RuntimeError(f"Failed to save data to cache: {e}") from e
 
         return self.data
 
-    def load(self,) -> pd.DataFrame:
+    @staticmethod
+    def _partition_keys(index: 'pd.DatetimeIndex') -> 'np.ndarray':
+        """
+        Get the monthly partition key (``year * 100 + month``) of each timestamp.
+
+        Args:
+            index: Timestamp index of the data
+        Returns:
+            np.ndarray: Partition key per row
+        """
+        import numpy as np
+
+        return np.asarray(index.year * 100 + index.month, dtype=np.int64)
+
+    def _write_partitions(
+            self,
+            data: 'pd.DataFrame',
+            partition_keys: 'np.ndarray',
+            keys: 'np.ndarray',
+            directory: Path,
+        ) -> None:
+        """
+        Write the given monthly partitions of sorted data.
+
+        Args:
+            data: Cache data sorted by timestamp
+            partition_keys: Partition key per row of data
+            keys: Partition keys to write
+            directory: Directory receiving the partition files
+        """
+        # Keys are non-decreasing on the sorted index, so each partition is a contiguous slice
+        for key in keys:
+            lo = partition_keys.searchsorted(key, side='left')
+            hi = partition_keys.searchsorted(key, side='right')
+            self._write_partition(data.iloc[lo:hi], key, directory)
+
+    def _migrate_legacy_cache(
+            self,
+            data: 'pd.DataFrame',
+            partition_keys: 'np.ndarray',
+            keys: 'np.ndarray',
+        ) -> None:
+        """
+        Replace a legacy single-file cache with a partition directory.
+
+        All partitions are written to a temporary directory first; the legacy
+        file is only moved aside and removed once every partition is on disk,
+        so a failed write leaves the old cache intact.
+
+        Args:
+            data: Full cache data sorted by timestamp
+            partition_keys: Partition key per row of data
+            keys: Partition keys to write
+        """
+        # Dot-prefixed siblings are never picked up as caches
+        tmp_dir = self.cache_path.with_name(f".{self.cache_path.name}.migrating")
+        legacy_path = self.cache_path.with_name(f".{self.cache_path.name}.legacy")
+
+        # Leftovers from an interrupted migration
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+        try:
+            self._write_partitions(data, partition_keys, keys, tmp_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        os.replace(self.cache_path, legacy_path)
+        os.replace(tmp_dir, self.cache_path)
+        legacy_path.unlink()
+        logger.info("Migrated legacy cache file to partitions: %s", self.cache_path)
+
+    def _write_partition(self, data: 'pd.DataFrame', key: int, directory: Optional[Path] = None) -> None:
+        """
+        Atomically write one monthly partition file.
+
+        Args:
+            data: Rows belonging to the partition
+            key: Partition key as returned by _partition_keys
+            directory: Target directory (default: cache_path)
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = (directory or self.cache_path) / f"{key // 100:04d}-{key % 100:02d}.parquet"
+        # Dot-prefixed temp files are ignored by Parquet dataset discovery
+        tmp_path = path.with_name(f".{path.name}.tmp")
+
+        # Preserve the timestamp index; ZSTD + dictionary encoding suits repetitive OHLCV bars
+        table = pa.Table.from_pandas(data, preserve_index=True)
+        pq.write_table(
+            table,
+            tmp_path,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=True,
+            data_page_size=1 << 20,
+            write_statistics=True,
+            # Bounded row groups keep per-group timestamp statistics useful for pushdown
+            row_group_size=131072,
+        )
+        os.replace(tmp_path, path)
+
+    def _partition_files(self) -> List[Path]:
+        """
+        Get the Parquet files backing this cache in chronological order.
+
+        Returns:
+            List[Path]: Monthly partition files, the legacy single file, or an empty list
+        """
+        if self.cache_path.is_dir():
+            return sorted(self.cache_path.glob('[0-9]*.parquet'))
+        if self.cache_path.is_file():
+            return [self.cache_path]
+        return []
+
+    def load(
+            self,
+            columns: Optional[List[str]] = None,
+            start: Optional['pd.Timestamp'] = None,
+            end: Optional['pd.Timestamp'] = None,
+        ) -> 'pd.DataFrame':
         """
         Load data from smart cache using Parquet format.
+
+        Column selection and the start/end window are pushed down to the Parquet
+        reader, so row groups outside the window and unselected columns are never
+        decoded. Only a full (unfiltered) load replaces ``self.data``.
+
+        If ``self.data`` was synced by the last save/load and the cache has not
+        changed on disk since (same mtime), it is served from memory instead.
+
         Args:
-            symbol: The symbol for the data
-            timeframe: Timeframe for the data
-            duration: Duration for the data
-            what_to_show: Type of data to retrieve (e.g., "TRADES", "MIDPOINT")
-            exchange: Exchange for the data (optional)
-            currency: Currency for the data (optional)
+            columns: Data columns to read (default: all). The timestamp index is always read.
+            start: Inclusive lower bound on the timestamp index (optional)
+            end: Inclusive upper bound on the timestamp index (optional).
+                Naive bounds are taken to be in the index timezone; aware bounds
+                are converted to it.
         Returns:
-            Optional[pd.DataFrame]: DataFrame containing the cached data, or None if not found
+            pd.DataFrame: DataFrame containing the cached data, or an empty DataFrame if not found
         """
+        import pandas as pd
+        import pyarrow.parquet as pq
+
+        # Taken before reading, so a concurrent write makes the next load re-read
+        mtime = self._cache_mtime()
+        if self.data is not None and not self.data.empty and mtime is not None and mtime == self._data_mtime:
+            logger.debug("Serving cache data from memory: %s", self.cache_path)
+            data = self.data
+            if start is not None or end is not None:
+                tz = getattr(data.index, 'tz', None)
+                data = data.loc[_as_index_tz(start, tz):_as_index_tz(end, tz)]
+            if columns is not None:
+                data = data[columns]
+            return data
 
-        if self.cache_path.exists():
+        files = self._partition_files()
+        if files:
             try:
-                self.data = pd.read_parquet(self.cache_path)
+                filters: Optional[List[Tuple[str, str, 'pd.Timestamp']]] = None
+                if start is not None or end is not None:
+                    schema = pq.read_schema(files[0])
+                    index_column = self._index_column(schema)
+                    tz = getattr(schema.field(index_column).type, 'tz', None)
+                    filters = []
+                    if start is not None:
+                        filters.append((index_column, '>=', _as_index_tz(start, tz)))
+                    if end is not None:
+                        filters.append((index_column, '<=', _as_index_tz(end, tz)))
+
+                table = pq.read_table(
+                    [str(f) for f in files],
+                    columns=columns,
+                    filters=filters,
+                    use_threads=True,
+                    use_pandas_metadata=True,
+                )
+                # self_destruct frees Arrow buffers as they are converted, avoiding a second copy
+                data = table.to_pandas(self_destruct=True, split_blocks=True)
                 
                 # Ensure timestamp is the index
-                if 'timestamp' in self.data.columns and not isinstance(self.data.index, pd.DatetimeIndex):
+                if 'timestamp' in data.columns and not isinstance(data.index, pd.DatetimeIndex):
                     logger.debug("Converting timestamp column to index after loading from cache.")
-                    self.data.set_index('timestamp', inplace=True)
-                elif not isinstance(self.data.index, pd.DatetimeIndex):
+                    data.set_index('timestamp', inplace=True)
+                elif not isinstance(data.index, pd.DatetimeIndex):
                     logger.warning("Loaded cache data doesn't have timestamp column or datetime index.")
-                
-                logger.info(f"Data loaded from cache: {self.cache_path}")
-                return self.data
+
+                if columns is None and filters is None:
+                    self.data = data
+                    self._data_mtime = mtime
+
+                logger.info("Data loaded from cache: %s", self.cache_path)
+                return data
             except Exception as e:
-                logger.error(f"Failed to load data from cache: {e}")
+                logger.error("Failed to load data from cache: %s", e)
                 raise RuntimeError(f"Failed to load data from cache: {e}") from e
         else:
-            logger.debug(f"No cached data found for: {self.cache_path}")
+            logger.debug("No cached data found for: %s", self.cache_path)
             
-        return pd.DataFrame(columns=DATA_COLUMNS)  # Return empty DataFrame if no cache found
+        return empty_data_frame()  # Return empty DataFrame if no cache found
+
+    def _cache_mtime(self) -> Optional[int]:
+        """
+        Get the modification time of the cache.
+
+        Partitions are replaced atomically inside the cache directory, which
+        bumps the directory's mtime on every write.
+
+        Returns:
+            Optional[int]: st_mtime_ns of cache_path, or None if it doesn't exist
+        """
+        try:
+            return self.cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _index_column(self, schema: Optional['pa.Schema'] = None) -> str:
+        """
+        Get the name of the Parquet column holding the timestamp index.
+
+        Args:
+            schema: Arrow schema of the cache file (read from disk if not given)
+        Returns:
+            str: Index column name as recorded in the pandas schema metadata
+        """
+        import pyarrow.parquet as pq
+
+        if schema is None:
+            schema = pq.read_schema(self._partition_files()[0])
+        pandas_metadata = schema.pandas_metadata or {}
+        index_columns = [c for c in pandas_metadata.get('index_columns', []) if isinstance(c, str)]
+        return index_columns[0] if index_columns else 'timestamp'
+
+    def _coverage_from_metadata(self) -> Optional[Tuple['pd.Timestamp', 'pd.Timestamp']]:
+        """
+        Get the cached time range from Parquet footer statistics.
+
+        Partitions do not overlap in time, so only the footers of the first and
+        last partition files are read; no data pages are decoded.
+
+        Returns:
+            Optional[Tuple[pd.Timestamp, pd.Timestamp]]: (cached_start, cached_end), or None
+            if the cache is empty or its row groups lack timestamp statistics
+        """
+        files = self._partition_files()
+        if not files:
+            return None
+
+        first = self._timestamp_statistics(files[0])
+        last = first if len(files) == 1 else self._timestamp_statistics(files[-1])
+        if first is None or last is None:
+            return None
+        return first[0], last[1]
+
+    def _timestamp_statistics(self, path: Path) -> Optional[Tuple['pd.Timestamp', 'pd.Timestamp']]:
+        """
+        Get the min/max of the timestamp index column of one Parquet file.
+
+        Args:
+            path: Parquet file to inspect
+        Returns:
+            Optional[Tuple[pd.Timestamp, pd.Timestamp]]: (min, max), or None if unavailable
+        """
+        import pandas as pd
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(path)
+        arrow_schema = metadata.schema.to_arrow_schema()
+        index_column = self._index_column(arrow_schema)
+        if index_column not in metadata.schema.names or metadata.num_row_groups == 0:
+            return None
+
+        column_idx = metadata.schema.names.index(index_column)
+        starts, ends = [], []
+        for i in range(metadata.num_row_groups):
+            statistics = metadata.row_group(i).column(column_idx).statistics
+            if statistics is None or not statistics.has_min_max:
+                return None
+            starts.append(statistics.min)
+            ends.append(statistics.max)
+
+        cached_start, cached_end = pd.Timestamp(min(starts)), pd.Timestamp(max(ends))
+        index_tz = getattr(arrow_schema.field(index_column).type, 'tz', None)
+        if index_tz and cached_start.tzinfo is not None:
+            cached_start = cached_start.tz_convert(index_tz)
+            cached_end = cached_end.tz_convert(index_tz)
+        return cached_start, cached_end
 
 
     @property
@@ -221,42 +590,57 @@ class CacheHandler:
         Returns:
             bool: True if cache provides sufficient coverage
         """
-        # Load cached data if not already loaded
-        if self.data.empty:
-            self.data = self.load()
-        
-        if self.data.empty:
-            logger.debug("No cached data available")
-            return False
-        
-        # Ensure data has timestamp index
-        if 'timestamp' in self.data.columns and not isinstance(self.data.index, pd.DatetimeIndex):
-            logger.debug("Converting timestamp column to index for coverage check.")
-            self.data.set_index('timestamp', inplace=True)
-        elif not isinstance(self.data.index, pd.DatetimeIndex):
-            logger.error("Cached data doesn't have proper datetime index or timestamp column.")
-            return False
-        
-        # Get cached data time range
-        cached_start = self.data.index.min()
-        cached_end = self.data.index.max()
+        import pandas as pd
+
+        # Reuse loaded data if available, otherwise try the footer statistics
+        if self.data is None or self.data.empty:
+            if not self.cache_path.exists():
+                logger.debug("No cached data available")
+                return False
+            coverage = self._coverage_from_metadata()
+        else:
+            coverage = None
+
+        if coverage is not None:
+            cached_start, cached_end = coverage
+        else:
+            # Statistics missing - read only the timestamp index
+            timestamps = self.load(columns=[]) if self.data is None or self.data.empty else self.data
+
+            # An index-only frame has no columns, so test the index rather than .empty
+            if len(timestamps.index) == 0:
+                logger.debug("No cached data available")
+                return False
+
+            # Ensure data has timestamp index
+            if 'timestamp' in timestamps.columns and not isinstance(timestamps.index, pd.DatetimeIndex):
+                logger.debug("Converting timestamp column to index for coverage check.")
+                timestamps = timestamps.set_index('timestamp')
+            elif not isinstance(timestamps.index, pd.DatetimeIndex):
+                logger.error("Cached data doesn't have proper datetime index or timestamp column.")
+                return False
+
+            # Get cached data time range
+            cached_start = timestamps.index.min()
+            cached_end = timestamps.index.max()
         
-        # Calculate expected data range for this request
-        expected_start, expected_end = get_cache_expected_range(
-            bar_size=self.bar_size,
-            end_date_time=end_date_time,
-            duration=duration,
-            timezone=timezone,
-            exchange=self.exchange
+        from .utils.market_utils import parse_end_time
+
+        # Key the memoized decision on the parsed end instant rather than the raw string.
+        # An empty or unparseable end_date_time means "now", so that decision must not be memoized.
+        end_key = ""
+        if end_date_time:
+            try:
+                end_key = parse_end_time(end_date_time, "UTC").strftime("%Y%m%d %H:%M:%S UTC")
+            except ValueError:
+                logger.debug("Could not parse end_date_time %r, checking coverage against now", end_date_time)
+        decide = _coverage_decision if end_key else _coverage_decision.__wrapped__
+        return decide(
+            cached_start,
+            cached_end,
+            self.bar_size,
+            self.exchange,
+            end_key,
+            duration,
+            timezone,
         )
-        
-        # Check if cache is sufficient
-        return is_cache_sufficient(
-            cached_start=cached_start,
-            cached_end=cached_end,
-            expected_start=expected_start,
-            expected_end=expected_end,
-            duration=duration,
-            bar_size=self.bar_size,
-            exchange=self.exchange
-        )
\ No newline at end of file
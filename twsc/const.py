@@ -1,4 +1,8 @@
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 SEC_TYPES = Literal[
     "STK",      # Stock
@@ -32,9 +36,39 @@ HISTORICAL_BAR_TYPES = Literal[
     "OPTION_OPEN_INTEREST",
 ]
 
-DATA_COLUMNS = [
+DATA_COLUMNS = (
     'timestamp', 'open', 'high', 'low', 'close', 'volume', 'wap', 'bar_count'
-]
+)
+
+# Column dtypes of an empty bar DataFrame
+DATA_DTYPES: Mapping[str, str] = MappingProxyType({
+    'timestamp': 'datetime64[ns]',
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'int64',
+    'wap': 'float64',
+    'bar_count': 'int32',
+})
+
+_EMPTY_DATA_FRAME: Optional['pd.DataFrame'] = None
+
+
+def empty_data_frame() -> 'pd.DataFrame':
+    """
+    Get an empty, typed DataFrame with DATA_COLUMNS.
+
+    The frame is built once on first use; callers receive a shallow copy.
+
+    Returns:
+        pd.DataFrame: Empty DataFrame with DATA_COLUMNS and DATA_DTYPES
+    """
+    global _EMPTY_DATA_FRAME
+    if _EMPTY_DATA_FRAME is None:
+        import pandas as pd
+        _EMPTY_DATA_FRAME = pd.DataFrame(columns=list(DATA_COLUMNS)).astype(dict(DATA_DTYPES))
+    return _EMPTY_DATA_FRAME.copy(deep=False)
 
 # ============================================================================
 # Trading Constants
@@ -87,18 +121,22 @@ ORDER_STATUS = Literal[
     "Unknown"
 ]
 
-# Tick Types for Live Data
-TICK_TYPES = {
+# Tick Types for Live Data (read-only)
+TICK_TYPES: Mapping[int, str] = MappingProxyType({
     0: "BID_SIZE",
-    1: "BID_PRICE", 
+    1: "BID_PRICE",
     2: "ASK_PRICE",
     3: "ASK_SIZE",
     4: "LAST_PRICE",
     5: "LAST_SIZE",
     6: "HIGH",
-    7: "LOW", 
+    7: "LOW",
     8: "VOLUME",
     9: "CLOSE_PRICE",
     14: "OPEN_PRICE",
-    # Add more tick types as needed
-}
\ No newline at end of file
+})
+
+# Reverse lookup: tick type name -> tick type id
+TICK_TYPES_BY_NAME: Mapping[str, int] = MappingProxyType(
+    {name: tick_id for tick_id, name in TICK_TYPES.items()}
+)
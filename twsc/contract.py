@@ -6,13 +6,16 @@ from ibapi.contract import Contract as IBContract
 
 # from .const import SEC_TYPES
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Contract:
     """
     Represents a financial contract/instrument.
     
     This is a simplified wrapper around the IBKR Contract object
     that provides a more Pythonic interface.
+
+    Contracts are immutable, hashable values: use ``dataclasses.replace``
+    to derive a modified contract.
     """
     symbol: str
     sec_type: str = "STK"
@@ -26,13 +29,16 @@ class Contract:
         """Convert to IBKR Contract object."""
         
         contract = IBContract()
-        contract.symbol = self.symbol
-        contract.secType = self.sec_type
-        contract.exchange = self.exchange
-        contract.currency = self.currency
-        contract.primaryExchange = self.primary_exchange
-        contract.localSymbol = self.local_symbol
-        contract.conId = self.con_id
+        # One dict update instead of seven attribute assignments
+        contract.__dict__.update({
+            'symbol': self.symbol,
+            'secType': self.sec_type,
+            'exchange': self.exchange,
+            'currency': self.currency,
+            'primaryExchange': self.primary_exchange,
+            'localSymbol': self.local_symbol,
+            'conId': self.con_id,
+        })
         
         return contract
     
@@ -8,7 +8,7 @@ from the final composed client class.
 """
 
 import logging
-from typing import Dict, Any, Optional, Callable, Protocol
+from typing import Dict, Any, Optional, Callable, Protocol, Tuple
 from threading import Thread
 
 from ibapi.contract import Contract as IBContract
@@ -26,11 +26,31 @@ class BaseMixin:
     This class provides common functionality and interface patterns
     that all mixins should follow.
     """
+
+    # initialize_mixin / cleanup_mixin implementations along the MRO, in MRO order.
+    # Computed once per class in __init_subclass__.
+    _init_hooks: Tuple[Callable, ...] = ()
+    _cleanup_hooks: Tuple[Callable, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the lifecycle hooks each class in the MRO defines itself."""
+        super().__init_subclass__(**kwargs)
+        # dict.fromkeys dedupes by identity while keeping MRO order
+        cls._init_hooks = tuple(dict.fromkeys(
+            c.__dict__['initialize_mixin'] for c in cls.__mro__ if 'initialize_mixin' in c.__dict__
+        ))
+        cls._cleanup_hooks = tuple(dict.fromkeys(
+            c.__dict__['cleanup_mixin'] for c in cls.__mro__ if 'cleanup_mixin' in c.__dict__
+        ))
     
     def __init__(self):
         """Initialize the base mixin."""
         self._initialized = False
-        self._request_id_counter = getattr(self, '_request_id_counter', 1000)
+        # IBKRClient.__init__ composes the mixins in a fixed order before any request is made,
+        # so plain assignment is safe and lets the hot paths skip hasattr() probes
+        self._request_id_counter = 1000
+        # Callbacks keyed by (callback_type, req_id) for a single lookup per event
+        self._callbacks: Dict[Tuple[str, int], Callable] = {}
         
     def _get_next_request_id(self) -> int:
         """
@@ -51,14 +71,8 @@ class BaseMixin:
             req_id: Request ID associated with the callback
             callback: Callback function
         """
-        if not hasattr(self, '_callbacks'):
-            self._callbacks = {}
-        
-        if callback_type not in self._callbacks:
-            self._callbacks[callback_type] = {}
-            
-        self._callbacks[callback_type][req_id] = callback
-        logger.debug(f"Registered {callback_type} callback for request {req_id}")
+        self._callbacks[(callback_type, req_id)] = callback
+        logger.debug("Registered %s callback for request %s", callback_type, req_id)
     
     def _unregister_callback(self, callback_type: str, req_id: int):
         """
@@ -68,10 +82,8 @@ class BaseMixin:
             callback_type: Type of callback
             req_id: Request ID to unregister
         """
-        if hasattr(self, '_callbacks') and callback_type in self._callbacks:
-            if req_id in self._callbacks[callback_type]:
-                del self._callbacks[callback_type][req_id]
-                logger.debug(f"Unregistered {callback_type} callback for request {req_id}")
+        if self._callbacks.pop((callback_type, req_id), None) is not None:
+            logger.debug("Unregistered %s callback for request %s", callback_type, req_id)
     
     def _execute_callback(self, callback_type: str, req_id: int, *args, **kwargs):
         """
@@ -83,11 +95,9 @@ class BaseMixin:
             *args: Positional arguments to pass to callback
             **kwargs: Keyword arguments to pass to callback
         """
-        if (hasattr(self, '_callbacks') and 
-            callback_type in self._callbacks and 
-            req_id in self._callbacks[callback_type]):
+        callback = self._callbacks.get((callback_type, req_id))
+        if callback is not None:
             try:
-                callback = self._callbacks[callback_type][req_id]
                 callback(*args, **kwargs)
             except Exception as e:
                 logger.error(f"Error executing {callback_type} callback for request {req_id}: {e}")
@@ -98,17 +108,17 @@ class BaseMixin:
         Override this method in subclasses to perform initialization.
         """
         if not self._initialized:
-            logger.debug(f"Initializing {self.__class__.__name__}")
+            logger.debug("Initializing %s", self.__class__.__name__)
             self._initialized = True
     
     def cleanup_mixin(self):
         """
         Cleanup mixin resources. Called when the client is disconnecting.
-        Override this method in subclasses to perform cleanup.
+        Override this method in subclasses to perform cleanup; overrides that
+        send cancellation requests should return how many they sent.
         """
-        if hasattr(self, '_callbacks'):
-            self._callbacks.clear()
-        logger.debug(f"Cleaned up {self.__class__.__name__}")
+        self._callbacks.clear()
+        logger.debug("Cleaned up %s", self.__class__.__name__)
 
 
 
@@ -9,9 +9,11 @@ Handles all connection-related operations including:
 """
 
 import logging
+import random
 import threading
 import time
-from typing import Optional, cast, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, cast, TYPE_CHECKING
 
 from .base import BaseMixin
 
@@ -20,6 +22,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Connection status notices (market data / HMDS farm OK, sec-def farm OK) sent with reqId -1
+_INFO_CODES = frozenset({2104, 2106, 2158})
+
 
 class ConnectionMixin(BaseMixin):
     """
@@ -34,8 +39,9 @@ class ConnectionMixin(BaseMixin):
         """Initialize the connection mixin."""
         super().__init__()
         
-        # Connection configuration
-        self.config = {
+        # Connection configuration: mutated only through set_connection_config,
+        # exposed read-only as self.config
+        self._config = {
             'host': "127.0.0.1",
             'port': 7497,
             'client_id': 1,
@@ -43,11 +49,14 @@ class ConnectionMixin(BaseMixin):
             'max_retries': 3,
             'retry_delay': 1.0
         }
+        self.config: Mapping[str, Any] = MappingProxyType(self._config)
         
         # Connection state
         self.is_connected = False
         self._api_thread: Optional[threading.Thread] = None
         self.next_valid_id: Optional[int] = None
+        # Set by nextValidId, the API's "fully connected" signal
+        self._connected_event = threading.Event()
     
     def set_connection_config(self, host: Optional[str] = None, port: Optional[int] = None, 
                              client_id: Optional[int] = None, timeout: Optional[int] = None,
@@ -64,19 +73,19 @@ class ConnectionMixin(BaseMixin):
             retry_delay: Delay between retry attempts
         """
         if host is not None:
-            self.config['host'] = host
+            self._config['host'] = host
         if port is not None:
-            self.config['port'] = port
+            self._config['port'] = port
         if client_id is not None:
-            self.config['client_id'] = client_id
+            self._config['client_id'] = client_id
         if timeout is not None:
-            self.config['timeout'] = timeout
+            self._config['timeout'] = timeout
         if max_retries is not None:
-            self.config['max_retries'] = max_retries
+            self._config['max_retries'] = max_retries
         if retry_delay is not None:
-            self.config['retry_delay'] = retry_delay
+            self._config['retry_delay'] = retry_delay
             
-        logger.debug(f"Updated connection config: {self.config}")
+        logger.debug("Updated connection config: %s", self._config)
     
     def connect_to_tws(self, host: Optional[str] = None, port: Optional[int] = None, 
                       client_id: Optional[int] = None, timeout: Optional[int] = None) -> bool:
@@ -101,38 +110,52 @@ class ConnectionMixin(BaseMixin):
         client_id = client_id or self.config["client_id"]
         timeout = timeout or self.config["timeout"] 
         
-        logger.debug(f"Attempting connection to {host}:{port} with client ID {client_id}")
-        connection_start = time.time()
-        
-        try:
-            # This requires the client to have EClient methods
-            client = cast('EClientProtocol', self)
-            client.connect(host, port, client_id)
-            
-            self._api_thread = threading.Thread(target=client.run, daemon=True)
-            self._api_thread.start()
-            logger.info(f"Started API thread for client ID {client_id}")
+        max_retries = max(1, int(self.config["max_retries"]))
+        client = cast('EClientProtocol', self)
+
+        for attempt in range(max_retries):
+            logger.debug("Attempting connection to %s:%s with client ID %s (attempt %s/%s)",
+                         host, port, client_id, attempt + 1, max_retries)
+            connection_start = time.time()
             
-            while time.time() - connection_start < timeout:
-                if client.isConnected():
+            try:
+                # This requires the client to have EClient methods
+                self._connected_event.clear()
+                self._join_stale_api_thread()
+                client.connect(host, port, client_id)
+                # EClient.connect reports socket/handshake failures via error() instead of raising
+                if not client.isConnected():
+                    raise ConnectionError(f"Could not connect to TWS/Gateway at {host}:{port}")
+                
+                self._start_api_thread()
+                logger.info("Started API thread for client ID %s", client_id)
+                
+                # Block until nextValidId arrives instead of polling
+                if self._connected_event.wait(timeout):
                     self.is_connected = True
                     elapsed = time.time() - connection_start
-                    logger.info(f"✅ Client {client_id}: successfully connected to TWS/Gateway in {elapsed:.2f}s")
+                    logger.info("✅ Client %s: successfully connected to TWS/Gateway in %.2fs", client_id, elapsed)
                     
                     # Initialize all mixins after successful connection
                     self._initialize_all_mixins()
                     return True
-                time.sleep(0.5)
+                
+                client.disconnect()
+                self.is_connected = False
+                raise TimeoutError("Connection to TWS/Gateway timed out")
             
-            client.disconnect()
-            self.is_connected = False
-            raise TimeoutError("Connection to TWS/Gateway timed out")
-        
-        except Exception as conn_ex:
-            # Connection attempt itself failed
-            elapsed = time.time() - connection_start
-            logger.error(f"Connection attempt failed after {elapsed:.2f}s: {conn_ex}")
-            return False
+            except Exception as conn_ex:
+                # Connection attempt itself failed
+                elapsed = time.time() - connection_start
+                logger.error(f"Connection attempt {attempt + 1}/{max_retries} failed after {elapsed:.2f}s: {conn_ex}")
+
+            if attempt + 1 < max_retries:
+                # Exponential backoff with jitter so clients don't retry in lockstep
+                delay = min(60.0, self.config["retry_delay"] * (2 ** attempt)) * random.uniform(0.5, 1.5)
+                logger.info("Retrying connection in %.2fs (attempt %s/%s)", delay, attempt + 2, max_retries)
+                time.sleep(delay)
+
+        return False
 
     def disconnect_from_tws(self) -> None:
         """
@@ -142,10 +165,12 @@ class ConnectionMixin(BaseMixin):
             logger.info("Disconnecting from TWS/Gateway")
             
             # Cleanup all mixins before disconnecting
-            self._cleanup_all_mixins()
+            pending_cancels = self._cleanup_all_mixins()
             
-            # Small delay to let cancellations process
-            time.sleep(1)
+            # TWS doesn't acknowledge cancellations, so allow a short, bounded
+            # delay for them to go out - and none when nothing was cancelled
+            if pending_cancels:
+                time.sleep(min(1.0, 0.05 * pending_cancels))
             
             # Disconnect from IB API
             cast('EClientProtocol', self).disconnect()
@@ -178,41 +203,58 @@ class ConnectionMixin(BaseMixin):
             "eclient_connected": cast('EClientProtocol', self).isConnected(),
             "next_valid_id": self.next_valid_id,
             "api_thread_alive": self._api_thread.is_alive() if self._api_thread else False,
-            "config": self.config.copy()
+            "config": self.config
         }
     
+    def _start_api_thread(self) -> None:
+        """Start the client message loop in a daemon thread."""
+        self._api_thread = threading.Thread(target=cast('EClientProtocol', self).run, daemon=True)
+        self._api_thread.start()
+
+    def _join_stale_api_thread(self, timeout: float = 3.0) -> None:
+        """
+        Wait for the message loop of this client's previous connection attempt.
+        
+        A stale loop would keep consuming messages after the new connect, so each
+        retry waits for the old thread before starting a new one.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        previous = self._api_thread
+        if previous is None or previous is threading.current_thread() or not previous.is_alive():
+            return
+        logger.debug("Waiting for previous API thread to finish")
+        previous.join(timeout=timeout)
+        if previous.is_alive():
+            logger.warning("Previous API thread of client %s is still running", self.config["client_id"])
+
     def _initialize_all_mixins(self):
         """Initialize all mixins after successful connection."""
-        # Initialize each mixin's initialize_mixin method on this instance
-        for mixin_class in self.__class__.__mro__:
-            if hasattr(mixin_class, 'initialize_mixin') and mixin_class is not object:
-                try:
-                    # Only call if the class defines its own initialize_mixin (not inherited)
-                    if 'initialize_mixin' in mixin_class.__dict__:
-                        mixin_class.initialize_mixin(self)
-                except Exception as e:
-                    logger.error(f"Error initializing mixin {mixin_class.__name__}: {e}")
+        # Each class's own initialize_mixin, collected once per class by BaseMixin
+        for hook in self._init_hooks:
+            try:
+                hook(self)
+            except Exception as e:
+                logger.error(f"Error initializing mixin {hook.__qualname__.split('.')[0]}: {e}")
     
-    def _cleanup_all_mixins(self):
-        """Cleanup all mixins before disconnection.""" 
-        # Track which mixins have been cleaned up to avoid duplicates
-        cleaned_mixins = set()
+    def _cleanup_all_mixins(self) -> int:
+        """
+        Cleanup all mixins before disconnection.
         
-        # Cleanup each mixin's cleanup_mixin method on this instance
-        for mixin_class in self.__class__.__mro__:
-            if hasattr(mixin_class, 'cleanup_mixin') and mixin_class is not object:
-                try:
-                    # Only call if the class defines its own cleanup_mixin (not inherited)
-                    # and hasn't been cleaned up yet
-                    if ('cleanup_mixin' in mixin_class.__dict__ and 
-                        mixin_class.__name__ not in cleaned_mixins):
-                        
-                        logger.debug(f"Cleaning up mixin: {mixin_class.__name__}")
-                        mixin_class.cleanup_mixin(self)
-                        cleaned_mixins.add(mixin_class.__name__)
-                        
-                except Exception as e:
-                    logger.error(f"Error cleaning up mixin {mixin_class.__name__}: {e}")
+        Returns:
+            int: Total number of cancellation requests sent by the mixins
+        """
+        pending_cancels = 0
+        # Each class's own cleanup_mixin, collected (and deduplicated) once per class by BaseMixin
+        for hook in self._cleanup_hooks:
+            mixin_name = hook.__qualname__.split('.')[0]
+            try:
+                logger.debug("Cleaning up mixin: %s", mixin_name)
+                pending_cancels += hook(self) or 0
+            except Exception as e:
+                logger.error(f"Error cleaning up mixin {mixin_name}: {e}")
+        return pending_cancels
     
 
     # ===============================================================
@@ -227,7 +269,8 @@ class ConnectionMixin(BaseMixin):
             orderId: The next valid order ID
         """
         self.next_valid_id = orderId
-        logger.info(f"Next Valid Order ID: {orderId}")
+        self._connected_event.set()
+        logger.info("Next Valid Order ID: %s", orderId)
 
     def error(self, reqId: int, errorTime: int, errorCode: int, errorString: str, advancedOrderRejectJson: str = "") -> None:
         """
@@ -240,9 +283,10 @@ class ConnectionMixin(BaseMixin):
             errorString: Human readable error message
             advancedOrderRejectJson: Advanced order rejection details (if applicable)
         """
-        if errorCode in [2104, 2106, 2158] and reqId == -1:  # Informational messages
-            logger.info(f"Info {errorCode}: {errorString}")
+        # Lazy %-style args: nothing is formatted when the level is disabled
+        if reqId == -1 and errorCode in _INFO_CODES:  # Informational messages
+            logger.info("Info %s: %s", errorCode, errorString)
         elif errorCode < 2000:  # Warning messages
-            logger.warning(f"Warning {errorCode}: {errorString} (ReqId: {reqId})")
+            logger.warning("Warning %s: %s (ReqId: %s)", errorCode, errorString, reqId)
         else:  # Error messages
-            logger.error(f"Error {errorCode}: {errorString} (ReqId: {reqId})")
+            logger.error("Error %s: %s (ReqId: %s)", errorCode, errorString, reqId)
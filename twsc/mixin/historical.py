@@ -7,17 +7,21 @@ Handles historical data operations including:
 - Cache integration for historical data
 """
 
+import asyncio
 import logging
-import time
-from typing import List, Any, Dict, Set, TYPE_CHECKING, cast
+import threading
+from typing import List, Any, Dict, Optional, Sequence, Set, Union, TYPE_CHECKING, cast
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 from ibapi.common import BarData
 
 from .base import BaseMixin
 from ..cache import CacheHandler
 from ..const import DATA_COLUMNS
+from ..utils.bar_buffer import BarBuffer
+from ..utils.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
     from .base import EClientProtocol
@@ -45,10 +49,12 @@ class HistoricalDataMixin(BaseMixin):
         self.timezone = timezone
         
         # Data storage for historical requests
-        # Dictionary to hold historical data by request ID
-        self.historical_data: Dict[int, List[Dict[str, Any]]] = {} 
+        # Columnar bar buffers by request ID
+        self.historical_data: Dict[int, BarBuffer] = {}
         # Set to track finished historical data requests
         self.historical_data_finished: Set[int] = set()
+        # Completion events by request ID, set in historicalDataEnd
+        self._hist_events: Dict[int, threading.Event] = {}
     
     def get_historical_data(
             self, 
@@ -86,10 +92,142 @@ class HistoricalDataMixin(BaseMixin):
         if chart_options is None:
             chart_options = []
             
+        cache = self._check_connection_and_cache(contract, bar_size, what_to_show)
+        if use_cache:
+            cached_df = self._load_covering_cache(cache, contract, end_date_time, duration)
+            if cached_df is not None:
+                return cached_df
+            
+        req_id = self._get_next_request_id()
+        self._send_historical_request(
+            req_id, contract, end_date_time, duration, bar_size, what_to_show,
+            use_rth, format_date, keep_up_to_date, chart_options
+        )
+
+        # Wait for data to be collected and convert to DataFrame
+        try:
+            data = self.wait_for_historical_data(req_id, timeout)
+        except TimeoutError as e:
+            # Clean up the failed request
+            self._cancel_historical_request(req_id)
+            raise e
+        return self._finalize_historical_data(data, cache, use_cache)
+
+    async def get_historical_data_async(
+            self, 
+            contract: 'Contract',
+            end_date_time: str = "",
+            duration: str = "1 D",
+            bar_size: str = "1 hour",
+            what_to_show: str = "TRADES",
+            use_rth: bool = True,
+            format_date: bool = True,
+            keep_up_to_date: bool = False,
+            chart_options=None,
+            use_cache: bool = True,
+            timeout: int = 60,
+            rate_limiter: Optional[RateLimiter] = None
+        ) -> pd.DataFrame:
+        """
+        Request historical data for a given contract without blocking the event loop.
+        
+        Takes the same arguments as get_historical_data; completion is signalled
+        from historicalDataEnd on the API thread via loop.call_soon_threadsafe.
+        
+        Args:
+            rate_limiter: Optional pacing limiter acquired before the request is sent
+            
+        Returns:
+            pd.DataFrame: Historical data as DataFrame
+        """
+        if chart_options is None:
+            chart_options = []
+            
+        # Cache directory setup, Parquet reads and the coverage check are blocking
+        cache = await asyncio.to_thread(self._check_connection_and_cache, contract, bar_size, what_to_show)
+        if use_cache:
+            cached_df = await asyncio.to_thread(self._load_covering_cache, cache, contract, end_date_time, duration)
+            if cached_df is not None:
+                return cached_df
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def _set_done() -> None:
+            if not done.done():
+                done.set_result(None)
+
+        req_id = self._get_next_request_id()
+        # Registered before the request so historicalDataEnd always finds it
+        self._register_callback('historical_data_end', req_id, lambda: loop.call_soon_threadsafe(_set_done))
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            self._send_historical_request(
+                req_id, contract, end_date_time, duration, bar_size, what_to_show,
+                use_rth, format_date, keep_up_to_date, chart_options
+            )
+            try:
+                await asyncio.wait_for(done, timeout)
+            except asyncio.TimeoutError:
+                logger.error("Timeout waiting for historical data request %s", req_id)
+                self._cancel_historical_request(req_id)
+                raise TimeoutError(f"Historical data request {req_id} timed out")
+        finally:
+            self._unregister_callback('historical_data_end', req_id)
+
+        self._hist_events.pop(req_id, None)
+        data = self.historical_data.get(req_id)
+        if data is None:
+            data = BarBuffer()
+        # Parsing and the cache write are blocking; keep them off the event loop
+        return await asyncio.to_thread(self._finalize_historical_data, data, cache, use_cache)
+
+    async def get_historical_data_many(
+            self,
+            contracts: Sequence['Contract'],
+            max_concurrent: int = 50,
+            rate_limiter: Optional[RateLimiter] = None,
+            return_exceptions: bool = False,
+            **kwargs
+        ) -> List[Any]:
+        """
+        Request historical data for several contracts concurrently.
+        
+        All requests are in flight at once (up to max_concurrent), so the total
+        wall-clock time is close to the slowest request rather than the sum.
+        
+        Args:
+            contracts: Contracts to request data for
+            max_concurrent: Maximum number of outstanding requests (IBKR allows ~50)
+            rate_limiter: Pacing limiter (default: 6 requests per 2 seconds)
+            return_exceptions: Return exceptions in place of failed results instead of raising
+            **kwargs: Arguments passed to get_historical_data_async
+            
+        Returns:
+            List[Any]: DataFrames (or exceptions) in the order of contracts
+        """
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(rate=6, per=2.0)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _fetch(contract: 'Contract') -> pd.DataFrame:
+            async with semaphore:
+                return await self.get_historical_data_async(contract, rate_limiter=rate_limiter, **kwargs)
+
+        return await asyncio.gather(*(_fetch(c) for c in contracts), return_exceptions=return_exceptions)
+
+    def _check_connection_and_cache(self, contract: 'Contract', bar_size: str, what_to_show: str) -> CacheHandler:
+        """
+        Ensure the client is connected and create the cache handler for a request.
+        
+        Raises:
+            ConnectionError: If not connected to TWS/Gateway
+        """
         if not getattr(self, 'is_connected', False) or not cast('EClientProtocol', self).isConnected():
             raise ConnectionError("Not connected to TWS/Gateway. Please connect first.")
         
-        cache = CacheHandler(
+        return CacheHandler(
             client=self,
             symbol=contract.symbol,
             bar_size=bar_size,
@@ -98,18 +236,35 @@ class HistoricalDataMixin(BaseMixin):
             currency=contract.currency,
         )
 
-        if use_cache:
-            cached_df = cache.load()
-            if cached_df is not None and not cached_df.empty:
-                # Check if cached data provides sufficient coverage for the request
-                if cache.check_coverage(end_date_time, duration, self.timezone):
-                    logger.info(f"Returning cached data for {contract.symbol} - cache covers requested timeframe")
-                    return cached_df
-                else:
-                    logger.info(f"Cache data exists but doesn't cover requested timeframe for {contract.symbol} - fetching new data")
-            
-        req_id = self._get_next_request_id()
-        logger.info(f"Requesting historical data for {contract.symbol} with request ID {req_id}")
+    def _load_covering_cache(
+            self, cache: CacheHandler, contract: 'Contract', end_date_time: str, duration: str
+        ) -> Optional[pd.DataFrame]:
+        """
+        Get cached data if it covers the requested timeframe.
+        
+        Returns:
+            Optional[pd.DataFrame]: Cached data, or None if a request is needed
+        """
+        cached_df = cache.load()
+        if cached_df is not None and not cached_df.empty:
+            # Check if cached data provides sufficient coverage for the request
+            if cache.check_coverage(end_date_time, duration, self.timezone):
+                logger.info("Returning cached data for %s - cache covers requested timeframe", contract.symbol)
+                return cached_df
+            else:
+                logger.info("Cache data exists but doesn't cover requested timeframe for %s - fetching new data", contract.symbol)
+        return None
+
+    def _send_historical_request(
+            self, req_id: int, contract: 'Contract', end_date_time: str, duration: str,
+            bar_size: str, what_to_show: str, use_rth: bool, format_date: bool,
+            keep_up_to_date: bool, chart_options
+        ) -> None:
+        """Register the completion event and bar buffer for req_id and send reqHistoricalData."""
+        logger.info("Requesting historical data for %s with request ID %s", contract.symbol, req_id)
+        # Registered before the request so historicalDataEnd always finds it
+        self._hist_events[req_id] = threading.Event()
+        self.historical_data[req_id] = BarBuffer()
         
         cast('EClientProtocol', self).reqHistoricalData(
             reqId=req_id,
@@ -124,28 +279,26 @@ class HistoricalDataMixin(BaseMixin):
             chartOptions=chart_options
         )
 
-        # Wait for data to be collected and convert to DataFrame
-        try:
-            data = self.wait_for_historical_data(req_id, timeout)
-            df = self.convert_to_dataframe(data)
-            
-            if use_cache and not df.empty:
-                cache_df = cache.save(data=df)
-                if cache_df is not None:
-                    df = cache_df
-                    
-            return df
-            
-        except TimeoutError as e:
-            # Clean up the failed request
-            # Type cast to get access to EClient methods
-            cast('EClientProtocol', self).cancelHistoricalData(req_id)
-            if req_id in self.historical_data:
-                del self.historical_data[req_id]
-            self.historical_data_finished.discard(req_id)
-            raise e
+    def _cancel_historical_request(self, req_id: int) -> None:
+        """Cancel a timed-out request and drop its state."""
+        # Type cast to get access to EClient methods
+        cast('EClientProtocol', self).cancelHistoricalData(req_id)
+        self.historical_data.pop(req_id, None)
+        self.historical_data_finished.discard(req_id)
+        self._hist_events.pop(req_id, None)
+
+    def _finalize_historical_data(self, data: BarBuffer, cache: CacheHandler, use_cache: bool) -> pd.DataFrame:
+        """Convert received bars to a DataFrame and merge them into the cache."""
+        df = self.convert_to_dataframe(data)
+        
+        if use_cache and not df.empty:
+            cache_df = cache.save(data=df)
+            if cache_df is not None:
+                df = cache_df
+                
+        return df
 
-    def wait_for_historical_data(self, req_id: int, timeout: int = 60) -> List[Dict[str, Any]]:
+    def wait_for_historical_data(self, req_id: int, timeout: int = 60) -> BarBuffer:
         """
         Wait for historical data request to complete and return the data.
         
@@ -154,32 +307,35 @@ class HistoricalDataMixin(BaseMixin):
             timeout: Timeout in seconds
             
         Returns:
-            List[Dict[str, Any]]: List of bar data dictionaries
+            BarBuffer: Bars collected for the request
             
         Raises:
             TimeoutError: If request times out
         """
-        start_time = time.time()
-        
-        logger.debug(f"[{req_id}] Waiting for historical data to complete")
+        logger.debug("[%s] Waiting for historical data to complete", req_id)
         
-        while req_id not in self.historical_data_finished:
-            if time.time() - start_time > timeout:
-                logger.error(f"Timeout waiting for historical data request {req_id}")
-                raise TimeoutError(f"Historical data request {req_id} timed out")
-            time.sleep(0.1)
+        event = self._hist_events.setdefault(req_id, threading.Event())
+        # historicalDataEnd marks the request finished before looking up the event
+        if req_id in self.historical_data_finished:
+            event.set()
+        if not event.wait(timeout):
+            logger.error(f"Timeout waiting for historical data request {req_id}")
+            raise TimeoutError(f"Historical data request {req_id} timed out")
+        self._hist_events.pop(req_id, None)
 
         # Return the collected data for this request
-        data = self.historical_data.get(req_id, [])
-        logger.debug(f"[{req_id}] Returning {len(data)} bars of historical data")
+        data = self.historical_data.get(req_id)
+        if data is None:
+            data = BarBuffer()
+        logger.debug("[%s] Returning %s bars of historical data", req_id, len(data))
         return data
 
-    def convert_to_dataframe(self, data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def convert_to_dataframe(self, data: Union[BarBuffer, List[Dict[str, Any]]]) -> pd.DataFrame:
         """
-        Convert list of bar data to pandas DataFrame.
+        Convert bar data to pandas DataFrame.
         
         Args:
-            data: List of bar data dictionaries
+            data: BarBuffer from a request, or a list of bar data dictionaries
             
         Returns:
             pd.DataFrame: DataFrame with bar data
@@ -188,37 +344,97 @@ class HistoricalDataMixin(BaseMixin):
             # Return empty DataFrame with expected columns
             return pd.DataFrame(columns=['date', 'open', 'high', 'low', 'close', 'volume', 'bar_count', 'wap'])
         
+        if isinstance(data, BarBuffer):
+            # Columns are already float64 arrays; dates become the index directly,
+            # without a temporary object column and set_index copy
+            df = data.to_frame(index=self._parse_bar_dates(data.dates))
+            logger.debug("Converted %s bars to DataFrame", len(df))
+            return df
+
         df = pd.DataFrame(data)
         
         # Convert date to datetime if it's not already
         if 'date' in df.columns:
-            try:
-                # IBKR date format: "20250710 09:30:00 US/Eastern" 
-                # Tell pandas the exact format and let it handle timezone conversion
-                df['date'] = pd.to_datetime(df['date'], format='%Y%m%d %H:%M:%S %Z')
-                
-                # Convert to user's timezone
-                df['date'] = df['date'].dt.tz_convert(self.timezone)
-                df.set_index('date', inplace=True)
-                
-            except Exception as e:
-                logger.warning(f"Could not convert date column to datetime: {e}")
-                # Try fallback - just set the string date as index
-                try:
-                    df.set_index('date', inplace=True)
-                except Exception:
-                    pass
+            df.index = self._parse_bar_dates(df.pop('date'))
         
         # Ensure numeric columns are properly typed for Parquet compatibility
         numeric_columns = ['open', 'high', 'low', 'close', 'volume', 'bar_count', 'wap']
         for col in numeric_columns:
-            if col in df.columns:
-                # Convert to float64 for consistent Parquet schema
+            # Convert to float64 for consistent Parquet schema; skip columns that already are
+            if col in df.columns and df[col].dtype != np.float64:
                 df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
         
-        logger.debug(f"Converted {len(df)} bars to DataFrame")
+        logger.debug("Converted %s bars to DataFrame", len(df))
         return df
 
+    def _parse_bar_dates(self, dates) -> pd.Index:
+        """
+        Parse IBKR bar date strings into an index in the client timezone.
+        
+        Args:
+            dates: Sequence of bar date strings
+            
+        Returns:
+            pd.Index: DatetimeIndex named 'date', or the raw strings if they can't be parsed
+        """
+        try:
+            # IBKR date format: "20250710 09:30:00 US/Eastern" 
+            index = self._parse_tz_suffixed_dates(dates)
+            if index is None:
+                # Unexpected layout: let pandas resolve %Z per element
+                index = pd.DatetimeIndex(pd.to_datetime(dates, format='%Y%m%d %H:%M:%S %Z'))
+            
+            # Convert to user's timezone
+            return index.tz_convert(self.timezone).rename('date')
+            
+        except Exception as e:
+            logger.warning(f"Could not convert date column to datetime: {e}")
+            # Fallback - just use the string date as index
+            return pd.Index(dates, name='date')
+
+    @staticmethod
+    def _parse_tz_suffixed_dates(dates) -> Optional[pd.DatetimeIndex]:
+        """
+        Parse bar dates of the form "<yyyyMMdd HH:mm:ss> <timezone>".
+        
+        The timezone suffix is split off so the timestamps go through the C
+        fixed-format parser, and each distinct timezone is applied once: a
+        single tz_localize in the usual case where a request has one suffix,
+        otherwise one per category of the suffix column.
+        
+        Args:
+            dates: Sequence of bar date strings
+            
+        Returns:
+            Optional[pd.DatetimeIndex]: Timezone-aware index, or None if the
+            dates aren't in this format or parsing fails
+        """
+        if not len(dates):
+            return None
+        stamp, sep, tz = dates[0].rpartition(' ')
+        # Intraday stamps without a suffix have exactly one space
+        if not sep or ' ' not in stamp:
+            return None
+        suffix = sep + tz
+        try:
+            if all(d.endswith(suffix) for d in dates):
+                cut = len(suffix)
+                index = pd.DatetimeIndex(pd.to_datetime([d[:-cut] for d in dates], format='%Y%m%d %H:%M:%S'))
+                # Bars arrive in order, so DST-ambiguous wall times can be inferred
+                return index.tz_localize(tz, ambiguous='infer')
+            
+            # Mixed suffixes: encode them as a categorical and localize one group at a time
+            parts = [d.rpartition(' ') for d in dates]
+            zones = pd.Categorical([p[2] for p in parts])
+            naive = pd.DatetimeIndex(pd.to_datetime([p[0] for p in parts], format='%Y%m%d %H:%M:%S'))
+            utc = np.empty(len(naive), dtype=np.int64)
+            for code, zone in enumerate(zones.categories):
+                mask = zones.codes == code
+                utc[mask] = naive[mask].tz_localize(zone, ambiguous='infer').asi8
+            return pd.DatetimeIndex(pd.to_datetime(utc, unit=naive.unit, utc=True))
+        except Exception:
+            return None
+
     def clear_pending_historical_requests(self) -> List[int]:
         """
         Clear all pending historical data requests and return their IDs.
@@ -226,44 +442,49 @@ class HistoricalDataMixin(BaseMixin):
         Returns:
             List[int]: List of request IDs that were cleared
         """
-        pending_req_ids = []
-        
-        # Find requests that are pending (not finished)
-        for req_id in list(self.historical_data.keys()):
-            if req_id not in self.historical_data_finished:
-                pending_req_ids.append(req_id)
+        # Find requests that are pending (not finished) with one C-level set difference
+        pending_req_ids = list(self.historical_data.keys() - self.historical_data_finished)
         
         # Clear the data
         self.historical_data.clear()
         self.historical_data_finished.clear()
         
-        logger.debug(f"Cleared {len(pending_req_ids)} pending historical data requests")
+        logger.debug("Cleared %s pending historical data requests", len(pending_req_ids))
         return pending_req_ids
 
     def clear_historical_data_storage(self):
         """Clear all historical data storage."""
         self.historical_data.clear()
         self.historical_data_finished.clear()
+        self._hist_events.clear()
         logger.debug("Cleared historical data storage")
 
-    def cleanup_mixin(self):
-        """Cleanup historical data mixin resources."""
+    def cleanup_mixin(self) -> int:
+        """
+        Cleanup historical data mixin resources.
+        
+        Returns:
+            int: Number of cancellation requests sent to TWS/Gateway
+        """
         # Prevent multiple cleanup calls
         if getattr(self, '_historical_mixin_cleaned_up', False):
-            return
+            return 0
         self._historical_mixin_cleaned_up = True
         
         # Cancel any pending requests
+        cancelled = 0
         req_ids_to_cancel = self.clear_pending_historical_requests()
         for req_id in req_ids_to_cancel:
             try:
-                logger.debug(f"Cancelling historical data request {req_id}")
+                logger.debug("Cancelling historical data request %s", req_id)
                 cast('EClientProtocol', self).cancelHistoricalData(req_id)
+                cancelled += 1
             except Exception as e:
                 logger.warning(f"Error canceling historical data request {req_id}: {e}")
         
         # Clear all historical data storage
         self.clear_historical_data_storage()
+        return cancelled
 
     # ==================== EWRAPPER CALLBACKS ====================
 
@@ -275,22 +496,14 @@ class HistoricalDataMixin(BaseMixin):
             reqId: Request ID
             bar: Bar data from IB API
         """
-        if reqId not in self.historical_data:
-            self.historical_data[reqId] = []
-        
-        bar_dict = {
-            'date': bar.date,
-            'open': float(bar.open),
-            'high': float(bar.high),
-            'low': float(bar.low),
-            'close': float(bar.close),
-            'volume': int(bar.volume),
-            'wap': float(bar.wap),
-            'bar_count': int(bar.barCount)
-        }
+        buffer = self.historical_data.get(reqId)
+        if buffer is None:
+            buffer = self.historical_data[reqId] = BarBuffer()
         
-        self.historical_data[reqId].append(bar_dict)
-        logger.debug(f"[{reqId}] Received historical bar: {bar.date}")
+        buffer.append(bar)
+        # Runs once per bar on the API thread; skip even the call when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Received historical bar: %s", reqId, bar.date)
 
     def historicalDataEnd(self, reqId: int, start: str, end: str) -> None:
         """
@@ -302,5 +515,10 @@ class HistoricalDataMixin(BaseMixin):
             end: End date of data
         """
         self.historical_data_finished.add(reqId)
+        event = self._hist_events.get(reqId)
+        if event is not None:
+            event.set()
+        # Wakes get_historical_data_async waiters
+        self._execute_callback('historical_data_end', reqId)
         bars_count = len(self.historical_data.get(reqId, []))
-        logger.info(f"[{reqId}] Historical data complete: {bars_count} bars from {start} to {end}")
+        logger.info("[%s] Historical data complete: %s bars from %s to %s", reqId, bars_count, start, end)
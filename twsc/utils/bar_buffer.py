@@ -0,0 +1,109 @@
+"""
+Columnar buffer for incoming historical bars.
+
+Bars arrive one at a time through the ``historicalData`` EWrapper callback,
+which runs on the API reader thread. The buffer only keeps a reference to each
+bar there; field extraction and float conversion happen later, in one batched
+pass per column, and the resulting float64 block is handed to pandas in one shot.
+"""
+
+import logging
+from typing import Iterator, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from ibapi.common import BarData
+
+logger = logging.getLogger(__name__)
+
+# Numeric bar columns, in block column order
+BAR_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'wap', 'bar_count')
+
+
+class BarBuffer:
+    """
+    Store for historical bars of a single request.
+
+    Numeric fields are materialized into one float64 block, the layout used
+    for the cache's Parquet schema. Bar dates are kept as the raw strings sent
+    by TWS and are parsed in a single vectorized call by the consumer.
+    """
+
+    __slots__ = ('_bars', '_values', '_dates')
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._bars: List['BarData'] = []
+        # Built on first access, reset by append
+        self._values: Optional[np.ndarray] = None
+        self._dates: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._bars)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate over bars as dictionaries (debugging / backwards compatibility)."""
+        for date, row in zip(self.dates, self.values.tolist()):
+            bar = dict(zip(BAR_COLUMNS, row))
+            bar['date'] = date
+            yield bar
+
+    def append(self, bar: 'BarData') -> None:
+        """
+        Append one bar.
+
+        Only stores the reference, keeping the API reader thread's per-bar work
+        to a list append.
+
+        Args:
+            bar: Bar data from IB API
+        """
+        self._bars.append(bar)
+        self._values = None
+        self._dates = None
+
+    @property
+    def dates(self) -> List[str]:
+        """Raw bar date strings."""
+        if self._dates is None:
+            self._dates = [bar.date for bar in self._bars]
+        return self._dates
+
+    @property
+    def values(self) -> np.ndarray:
+        """Numeric bar values as a (len, len(BAR_COLUMNS)) float64 array."""
+        if self._values is None:
+            bars = self._bars
+            n = len(bars)
+            # Column-major block: each column is filled by one C-level fromiter pass,
+            # and the transposed view is the layout pandas stores a float block in
+            block = np.empty((len(BAR_COLUMNS), n), dtype=np.float64)
+            block[0] = np.fromiter((b.open for b in bars), dtype=np.float64, count=n)
+            block[1] = np.fromiter((b.high for b in bars), dtype=np.float64, count=n)
+            block[2] = np.fromiter((b.low for b in bars), dtype=np.float64, count=n)
+            block[3] = np.fromiter((b.close for b in bars), dtype=np.float64, count=n)
+            block[4] = np.fromiter((int(b.volume) for b in bars), dtype=np.float64, count=n)
+            block[5] = np.fromiter((b.wap for b in bars), dtype=np.float64, count=n)
+            block[6] = np.fromiter((b.barCount for b in bars), dtype=np.float64, count=n)
+            self._values = block.T
+        return self._values
+
+    def to_frame(self, index: Optional['pd.Index'] = None) -> 'pd.DataFrame':
+        """
+        Build a DataFrame with typed numeric columns in one shot.
+
+        Args:
+            index: Index for the rows, typically the parsed dates. If omitted,
+                the raw date strings are added as a ``date`` column instead.
+
+        Returns:
+            pd.DataFrame: One row per bar with BAR_COLUMNS
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(self.values, columns=list(BAR_COLUMNS), index=index, copy=False)
+        if index is None:
+            df.insert(0, 'date', self.dates)
+        return df
@@ -5,12 +5,33 @@ This module provides functions for determining if cached data is sufficient
 for a request using market-hours-based logic.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Tuple, Optional
+import functools
 import logging
+from datetime import date, time
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_MINUTE = 60_000_000_000
+
+# Regular session open/close (market local time) assumed by the coverage logic
+_MARKET_OPEN_TIME = time(9, 30)
+_MARKET_CLOSE_TIME = time(16, 0)
+
+# Coverage tolerances used by is_cache_sufficient
+_START_TOLERANCE = pd.Timedelta(minutes=15)
+_END_TOLERANCE = pd.Timedelta(minutes=10)
+
+
+def _at_market_time(day: date, clock: time, market_tz: str) -> pd.Timestamp:
+    """Build a tz-aware Timestamp from components, avoiding a string parse."""
+    return pd.Timestamp(
+        year=day.year, month=day.month, day=day.day,
+        hour=clock.hour, minute=clock.minute, tz=market_tz
+    )
+
 
 def get_cache_expected_range(
     bar_size: str,
@@ -36,28 +57,53 @@ def get_cache_expected_range(
         
     Returns:
         Tuple[pd.Timestamp, pd.Timestamp]: (expected_start, expected_end)
+    
+    Note:
+        The current time is floored to the minute so results can be memoized;
+        the coverage check tolerates far larger differences.
     """
-    from .market_utils import MARKET_CONFIGS, is_market_open
+    if current_time is None:
+        current_time = pd.Timestamp.now(tz=timezone)
+    return _get_cache_expected_range_cached(
+        bar_size, end_date_time, duration, timezone, exchange,
+        current_time.value // _NS_PER_MINUTE
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cache_expected_range_cached(
+    bar_size: str,
+    end_date_time: str,
+    duration: str,
+    timezone: str,
+    exchange: str,
+    current_minute: int
+) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """
+    Pure core of get_cache_expected_range, keyed by the current UTC minute.
+    
+    Args:
+        current_minute: Current time as whole minutes since the Unix epoch
+        
+    Returns:
+        Tuple[pd.Timestamp, pd.Timestamp]: (expected_start, expected_end)
+    """
+    from .market_utils import MARKET_CONFIGS, is_market_open, parse_end_time
     
     # Get market configuration
     config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
     market_tz = config["timezone"]
+    now = pd.Timestamp(current_minute * _NS_PER_MINUTE, tz="UTC")
     
     # Determine end time
     if end_date_time == "":
-        if current_time is not None:
-            end_time = current_time.tz_convert(market_tz)
-        else:
-            end_time = pd.Timestamp.now(tz=timezone).tz_convert(market_tz)
+        end_time = now.tz_convert(market_tz)
     else:
         try:
-            # Parse IBKR datetime format 
-            end_time = pd.to_datetime(end_date_time, utc=True).tz_convert(market_tz)
+            # Parse IBKR datetime format, including the "YYYYMMDD HH:MM:SS <tz>" form
+            end_time = parse_end_time(end_date_time, market_tz)
         except Exception:
-            if current_time is not None:
-                end_time = current_time.tz_convert(market_tz)
-            else:
-                end_time = pd.Timestamp.now(tz=timezone).tz_convert(market_tz)
+            end_time = now.tz_convert(market_tz)
     
     # Calculate the expected market hours range based on current market status
     if is_market_open(end_time, exchange):
@@ -75,7 +121,7 @@ def get_cache_expected_range(
             trading_date = current_date - pd.Timedelta(days=2)  # Friday
         else:
             # Weekday - determine which trading day's data to expect
-            if end_time.time() >= pd.Timestamp("16:00:00").time():
+            if end_time.time() >= _MARKET_CLOSE_TIME:
                 # After market close - expect same day's complete data
                 trading_date = current_date
             else:
@@ -84,7 +130,7 @@ def get_cache_expected_range(
                 trading_date = current_date - pd.Timedelta(days=1)
         
         # Market end is the close of the trading day
-        market_end = pd.Timestamp(f"{trading_date} 16:00:00", tz=market_tz)
+        market_end = _at_market_time(trading_date, _MARKET_CLOSE_TIME, market_tz)
     
     # Parse duration to determine how many trading days to expect
     try:
@@ -116,21 +162,17 @@ def get_cache_expected_range(
     # Calculate start time based on number of trading days
     if trading_days == 1:
         # For 1 day, use the logic we already have
-        market_start = pd.Timestamp(f"{trading_date} 09:30:00", tz=market_tz)
+        market_start = _at_market_time(trading_date, _MARKET_OPEN_TIME, market_tz)
     else:
         # For multiple days, go back the appropriate number of trading days
-        start_date = trading_date
-        days_back = trading_days - 1  # -1 because we already have the end trading day
+        # (weekdays, -1 because we already have the end trading day).
+        # roll='forward' counts a weekend trading_date from the next Monday,
+        # matching a day-by-day walk back that skips weekends.
+        start_date = np.busday_offset(np.datetime64(trading_date, 'D'), -(trading_days - 1), roll='forward')
         
-        while days_back > 0:
-            start_date = start_date - pd.Timedelta(days=1)
-            # Skip weekends
-            if start_date.weekday() < 5:  # Monday=0, Friday=4
-                days_back -= 1
-        
-        market_start = pd.Timestamp(f"{start_date} 09:30:00", tz=market_tz)
+        market_start = _at_market_time(start_date.astype(date), _MARKET_OPEN_TIME, market_tz)
     
-    logger.debug(f"Expected market hours range: {market_start} to {market_end}")
+    logger.debug("Expected market hours range: %s to %s", market_start, market_end)
     return market_start, market_end
 
 
@@ -162,25 +204,24 @@ def is_cache_sufficient(
         bool: True if cache covers the expected market hours
     """
     # Simple coverage check: Does cache cover the expected market hours?
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Cache: %s to %s", cached_start, cached_end)
+        logger.debug("Expected: %s to %s", expected_start, expected_end)
     
     # Allow small tolerance for market open variations (e.g., 9:30 vs 9:35)
-    start_tolerance = pd.Timedelta(minutes=15)
-    start_covered = cached_start <= (expected_start + start_tolerance)
-    
+    start_covered = cached_start <= (expected_start + _START_TOLERANCE)
     # Allow small tolerance for market close variations (e.g., early close, missing last few bars)
-    end_tolerance = pd.Timedelta(minutes=10)
-    end_covered = cached_end >= (expected_end - end_tolerance)
-    
-    logger.debug(f"Cache: {cached_start} to {cached_end}")
-    logger.debug(f"Expected: {expected_start} to {expected_end}")
-    logger.debug(f"Start covered: {start_covered} (tolerance: 15min)")
-    logger.debug(f"End covered: {end_covered} (tolerance: 10min)")
-    
-    result = start_covered and end_covered
-    
-    if result:
-        logger.debug("Cache covers expected market hours - using cached data")
-    else:
-        logger.debug("Cache insufficient for expected market hours - fetching new data")
+    # Only evaluated when the start is covered
+    result = start_covered and cached_end >= (expected_end - _END_TOLERANCE)
+    
+    if debug:
+        logger.debug("Start covered: %s (tolerance: 15min)", start_covered)
+        if start_covered:
+            logger.debug("End covered: %s (tolerance: 10min)", result)
+        if result:
+            logger.debug("Cache covers expected market hours - using cached data")
+        else:
+            logger.debug("Cache insufficient for expected market hours - fetching new data")
     
     return result
@@ -1,5 +1,20 @@
 # Setup default logging configuration for the application
 import logging
+from typing import Dict, Optional, Tuple
+
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+_IBAPI_LOGGER = logging.getLogger("ibapi")
+
+# setup_logging arguments -> logger returned for them
+_LOGGERS: Dict[Tuple[Optional[str], bool, bool, str, str], logging.Logger] = {}
 
 def setup_logging(
         name=None, 
@@ -11,12 +26,19 @@ def setup_logging(
     """
     Set up the logging configuration for the application.
     
+    Repeat calls with the same arguments return the logger from the first call
+    without reconfiguring.
+
     Args:
         level (str): The logging level to set. Default is "INFO".
     """
 
-    ibapi_log = logging.getLogger("ibapi")
-    ibapi_log.setLevel(getattr(logging, ibapi_level.upper(), logging.WARNING))
+    key = (name, with_time, with_name, level, ibapi_level)
+    logger = _LOGGERS.get(key)
+    if logger is not None:
+        return logger
+
+    _IBAPI_LOGGER.setLevel(_LEVELS.get(ibapi_level.upper(), logging.WARNING))
 
     # exclude packagge name from the log messages
     
@@ -34,9 +56,10 @@ def setup_logging(
 
     logging.basicConfig(
         format=format,
-        level=getattr(logging, level.upper(), logging.INFO)
+        level=_LEVELS.get(level.upper(), logging.INFO)
     )
     logger = logging.getLogger(name or __name__)
     logger.info("Logging is set up with level: %s", level)
 
+    _LOGGERS[key] = logger
     return logger
@@ -10,10 +10,15 @@ This module provides utilities for:
 The functiondef get_market_timezone(exchange: str = "SMART") -> str:to be intuitive and broadly useful, not just for caching.
 """
 
+import functools
 import re
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, time as dt_time, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 import logging
 
 # Optional exchange_calendars integration
@@ -24,6 +29,13 @@ try:
 except ImportError:
     HAS_EXCHANGE_CALENDARS = False
 
+# Optional ciso8601 for fast end_date_time parsing
+try:
+    import ciso8601  # type: ignore[import-not-found]
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +43,17 @@ logger = logging.getLogger(__name__)
 # Duration and Time Parsing
 # ============================================================================
 
+# Seconds per IBKR duration unit (months and years are approximated as 30 / 365 days)
+_UNIT_SECONDS = {
+    'S': 1,
+    'D': 86400,
+    'W': 7 * 86400,
+    'M': 30 * 86400,
+    'Y': 365 * 86400,
+}
+
+
+@functools.lru_cache(maxsize=128)
 def parse_ibkr_duration(duration: str) -> timedelta:
     """
     Parse IBKR duration string into Python timedelta.
@@ -50,28 +73,31 @@ def parse_ibkr_duration(duration: str) -> timedelta:
     """
     duration = duration.strip().upper()
     
-    # Parse the duration string using regex
-    match = re.match(r'^(\d+)\s*([SDWMY])$', duration)
-    if not match:
+    # "<digits>[ ]<unit>": dispatch on the trailing unit letter
+    multiplier = _UNIT_SECONDS.get(duration[-1:])
+    amount = duration[:-1].rstrip()
+    if multiplier is None or not (amount.isascii() and amount.isdigit()):
         raise ValueError(f"Invalid duration format: {duration}")
     
-    amount, unit = match.groups()
-    amount = int(amount)
-    
-    if unit == 'S':
-        return timedelta(seconds=amount)
-    elif unit == 'D':
-        return timedelta(days=amount)
-    elif unit == 'W':
-        return timedelta(weeks=amount)
-    elif unit == 'M':
-        # Approximate months as 30 days
-        return timedelta(days=amount * 30)
-    elif unit == 'Y':
-        # Approximate years as 365 days
-        return timedelta(days=amount * 365)
-    else:
-        raise ValueError(f"Unsupported duration unit: {unit}")
+    return timedelta(seconds=int(amount) * multiplier)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_zone(timezone: str) -> ZoneInfo:
+    """
+    Get the ZoneInfo for a timezone name, constructed once per name.
+    
+    Args:
+        timezone: IANA timezone name (e.g., "US/Eastern")
+        
+    Returns:
+        ZoneInfo: Timezone object
+    """
+    return ZoneInfo(timezone)
+
+
+# timezone -> (wall-clock second, Timestamp.now in that timezone)
+_NOW_CACHE: Dict[str, Tuple[int, pd.Timestamp]] = {}
 
 
 def parse_end_time(end_date_time: str, timezone: str) -> pd.Timestamp:
@@ -86,15 +112,61 @@ def parse_end_time(end_date_time: str, timezone: str) -> pd.Timestamp:
         
     Returns:
         pd.Timestamp: Parsed timestamp in specified timezone
+        
+    Note:
+        The current time is computed once per wall-clock second and timezone,
+        so bursts of requests within a second share the same end time.
     """
     if end_date_time == "":
-        return pd.Timestamp.now(tz=timezone)
+        second = int(time.time())
+        cached = _NOW_CACHE.get(timezone)
+        if cached is not None and cached[0] == second:
+            return cached[1]
+        now = pd.Timestamp.now(tz=_get_zone(timezone))
+        _NOW_CACHE[timezone] = (second, now)
+        return now
     else:
+        return _parse_ibkr_end_time(end_date_time).tz_convert(timezone)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ibkr_end_time(end_date_time: str) -> pd.Timestamp:
+    """
+    Parse an IBKR end_date_time string to a UTC timestamp.
+    
+    The usual "YYYYMMDD HH:MM:SS <tz>" form is rearranged into ISO format and
+    parsed directly (with ciso8601 when installed); anything else goes
+    through pd.to_datetime.
+    
+    Args:
+        end_date_time: Non-empty IBKR end date time string
+        
+    Returns:
+        pd.Timestamp: Parsed timestamp in UTC
+    """
+    parts = end_date_time.split(' ')
+    if len(parts) == 3 and len(parts[0]) == 8 and len(parts[1]) == 8:
+        day, clock, tz_name = parts
+        iso = f"{day[0:4]}-{day[4:6]}-{day[6:8]}T{clock}"
         try:
-            return pd.to_datetime(end_date_time, format='%Y%m%d %H:%M:%S %Z', utc=True).tz_convert(timezone)
-        except ValueError:
-            # Fallback for different timezone formats
-            return pd.to_datetime(end_date_time, utc=True).tz_convert(timezone)
+            if HAS_CISO8601:
+                naive = ciso8601.parse_datetime_as_naive(iso)
+            else:
+                naive = datetime.fromisoformat(iso)
+            aware = naive.replace(tzinfo=_get_zone(tz_name))
+            # Both folds agree unless the wall time is ambiguous or skipped by a
+            # DST transition; leave those to pandas, which rejects them
+            if aware.utcoffset() == aware.replace(fold=1).utcoffset():
+                return pd.Timestamp(aware.astimezone(dt_timezone.utc))
+        except (ValueError, KeyError):
+            # Unknown timezone name or malformed fields
+            pass
+    
+    try:
+        return pd.to_datetime(end_date_time, format='%Y%m%d %H:%M:%S %Z', utc=True)
+    except ValueError:
+        # Fallback for different timezone formats
+        return pd.to_datetime(end_date_time, utc=True)
 
 
 # ============================================================================
@@ -130,14 +202,16 @@ def get_time_range_for_request(
     end_time = parse_end_time(end_date_time, timezone)
     
     # Optionally align to bar boundary (useful for real-time requests during market hours)
-    if align_to_bars and end_date_time == "" and is_market_open(end_time, exchange):
-        end_time = align_to_bar_boundary(end_time, bar_size)
+    # Daily bars align to the day whatever the market state, so skip the calendar check
+    if align_to_bars and end_date_time == "":
+        if _parse_bar_size_to_freq(bar_size) == "1D" or is_market_open(end_time, exchange):
+            end_time = align_to_bar_boundary(end_time, bar_size)
     
     # Calculate start time
     duration_delta = parse_ibkr_duration(duration)
     start_time = end_time - duration_delta
     
-    logger.debug(f"Time range: {start_time} to {end_time}")
+    logger.debug("Time range: %s to %s", start_time, end_time)
     return start_time, end_time
 
 
@@ -164,7 +238,7 @@ def align_to_bar_boundary(timestamp: pd.Timestamp, bar_size: str) -> pd.Timestam
 
 # Market configurations for different exchanges
 # Maps IBKR exchange names to exchange_calendars codes and basic config
-MARKET_CONFIGS = {
+_RAW_MARKET_CONFIGS = {
     # US Markets
     "SMART": {
         "timezone": "US/Eastern", 
@@ -219,7 +293,105 @@ MARKET_CONFIGS = {
 }
 
 
-def is_market_open(timestamp: pd.Timestamp, exchange: str = "SMART") -> bool:
+def _parse_hhmm(value: str) -> dt_time:
+    """
+    Parse an "HH:MM" string by slicing, without strptime.
+    
+    Args:
+        value: Time of day (e.g., "09:30")
+        
+    Returns:
+        dt_time: Parsed time
+    """
+    return dt_time(int(value[:2]), int(value[3:5]))
+
+
+def _build_configs(raw_configs: dict) -> dict:
+    """
+    Build MARKET_CONFIGS with the open/close times and timezone pre-parsed.
+    
+    Each entry keeps its original string fields and gains ``open_t`` /
+    ``close_t`` (datetime.time) and ``tz`` (ZoneInfo), so the market hours
+    checks don't re-parse them on every call.
+    
+    Args:
+        raw_configs: Exchange name to basic config mapping
+        
+    Returns:
+        dict: Exchange name to config with parsed fields added
+    """
+    configs = {}
+    for exchange, config in raw_configs.items():
+        configs[exchange] = {
+            **config,
+            "open_t": _parse_hhmm(config["open"]),
+            "close_t": _parse_hhmm(config["close"]),
+            "tz": _get_zone(config["timezone"]),
+        }
+    return configs
+
+
+MARKET_CONFIGS = _build_configs(_RAW_MARKET_CONFIGS)
+
+
+@dataclass(slots=True, frozen=True)
+class _ExchInfo:
+    """Resolved market configuration for one exchange."""
+    timezone: str
+    tz: ZoneInfo
+    open: str
+    close: str
+    open_t: dt_time
+    close_t: dt_time
+    calendar_code: Optional[str]
+    has_advanced: bool
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve(exchange: str) -> _ExchInfo:
+    """
+    Resolve an exchange name to its market configuration.
+    
+    Unknown exchanges fall back to the SMART configuration.
+    
+    Args:
+        exchange: Exchange name
+        
+    Returns:
+        _ExchInfo: Market configuration with derived fields
+    """
+    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    calendar_code = config.get("calendar_code")
+    return _ExchInfo(
+        timezone=config["timezone"],
+        tz=config["tz"],
+        open=config["open"],
+        close=config["close"],
+        open_t=config["open_t"],
+        close_t=config["close_t"],
+        calendar_code=calendar_code,
+        has_advanced=HAS_EXCHANGE_CALENDARS and calendar_code is not None,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_cached_calendar(calendar_code: str):
+    """
+    Get an exchange_calendars calendar, resolved once per calendar code.
+    
+    Args:
+        calendar_code: exchange_calendars code (e.g., "XNYS")
+        
+    Returns:
+        ExchangeCalendar: Calendar instance
+    """
+    return get_calendar(calendar_code)
+
+
+def is_market_open(
+    timestamp: Union[pd.Timestamp, pd.DatetimeIndex, pd.Series, np.ndarray],
+    exchange: str = "SMART"
+) -> Union[bool, np.ndarray]:
     """
     Check if a timestamp is within market hours for a given exchange.
     
@@ -227,56 +399,58 @@ def is_market_open(timestamp: pd.Timestamp, exchange: str = "SMART") -> bool:
     including holidays and special sessions when available.
     
     Args:
-        timestamp: Timestamp to check
+        timestamp: Timestamp to check. A DatetimeIndex, Series or datetime64
+            array is handed to is_market_open_array.
         exchange: Exchange to check market hours for
         
     Returns:
-        bool: True if timestamp is within market hours
+        Union[bool, np.ndarray]: True if timestamp is within market hours;
+        a boolean mask (np.ndarray) for array-like input
         
     Note:
         When exchange_calendars is available, this provides accurate
         market hours including holidays. Otherwise falls back to
         basic timezone and hour checking.
     """
+    if isinstance(timestamp, (pd.Index, pd.Series, np.ndarray)):
+        return is_market_open_array(timestamp, exchange)
+    
     # Get market configuration
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    info = _resolve(exchange)
     
     # Try to use exchange_calendars for accurate market hours
-    if HAS_EXCHANGE_CALENDARS and "calendar_code" in config:
+    if info.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(info.calendar_code)
             
             # Check if the timestamp is during a trading session
             # exchange_calendars expects timezone-aware timestamps
             if timestamp.tz is None:
                 # If timestamp is naive, assume it's in the market's timezone
-                timestamp = timestamp.tz_localize(config["timezone"])
+                timestamp = timestamp.tz_localize(info.timezone)
             
             return calendar.is_open_at_time(timestamp)
             
         except Exception as e:
-            logger.debug(f"exchange_calendars failed for {exchange}: {e}, falling back to basic check")
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
     
     # Fallback to basic market hours checking
-    return _is_market_open_basic(timestamp, config)
+    return _is_market_open_basic(timestamp, info)
 
 
-def _is_market_open_basic(timestamp: pd.Timestamp, config: dict) -> bool:
+def _is_market_open_basic(timestamp: pd.Timestamp, info: _ExchInfo) -> bool:
     """
     Basic market hours checking without holiday support.
     
     Args:
         timestamp: Timestamp to check
-        config: Market configuration dictionary
+        info: Resolved market configuration
         
     Returns:
         bool: True if timestamp is within basic market hours
     """
-    market_tz = config["timezone"]
-    
     # Convert timestamp to market timezone
-    market_time = timestamp.tz_convert(market_tz)
+    market_time = timestamp.tz_convert(info.tz)
     
     # Skip weekends
     if market_time.weekday() >= 5:  # Saturday = 5, Sunday = 6
@@ -284,10 +458,99 @@ def _is_market_open_basic(timestamp: pd.Timestamp, config: dict) -> bool:
     
     # Check market hours
     time_of_day = market_time.time()
-    market_open = datetime.strptime(config["open"], "%H:%M").time()
-    market_close = datetime.strptime(config["close"], "%H:%M").time()
     
-    return market_open <= time_of_day <= market_close
+    return info.open_t <= time_of_day <= info.close_t
+
+
+def is_market_open_array(
+    timestamps: Union[pd.DatetimeIndex, pd.Series, np.ndarray],
+    exchange: str = "SMART"
+) -> np.ndarray:
+    """
+    Vectorized is_market_open for many timestamps at once.
+    
+    Each timestamp is matched to its session with one searchsorted over the
+    calendar's session opens, instead of a per-element is_open_at_time call.
+    
+    Args:
+        timestamps: Timestamps to check; naive values are taken to be in the
+            market's timezone
+        exchange: Exchange to check market hours for
+        
+    Returns:
+        np.ndarray: Boolean mask, True where the timestamp is within market hours
+    """
+    info = _resolve(exchange)
+    
+    timestamps = pd.DatetimeIndex(timestamps)
+    if timestamps.tz is None:
+        timestamps = timestamps.tz_localize(info.timezone)
+    if len(timestamps) == 0:
+        return np.zeros(0, dtype=bool)
+    
+    if info.has_advanced:
+        try:
+            calendar = _get_cached_calendar(info.calendar_code)
+            return _is_open_at_times(calendar, timestamps)
+        except Exception as e:
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
+    
+    return _is_market_open_basic_array(timestamps, info)
+
+
+def _is_open_at_times(calendar, timestamps: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Array counterpart of ``calendar.is_open_at_time`` (open inclusive, close exclusive).
+    
+    Args:
+        calendar: exchange_calendars calendar
+        timestamps: Timezone-aware timestamps
+        
+    Returns:
+        np.ndarray: Boolean mask of timestamps during a session
+    """
+    # Calendar arrays are in nanoseconds whatever the index resolution
+    nanos = timestamps.tz_convert("UTC").as_unit("ns").asi8
+    if nanos.min() < calendar.first_minute.value or nanos.max() > calendar.last_minute.value:
+        raise ValueError("timestamps outside calendar bounds")
+    
+    # Latest session open at or before each timestamp
+    session_idx = np.searchsorted(calendar.opens_nanos, nanos, side="right") - 1
+    is_open = (session_idx >= 0) & (nanos < calendar.closes_nanos[session_idx])
+    
+    if calendar.has_break:
+        # Sessions without a break hold NaT (int64 min), which never matches
+        in_break = (
+            (nanos >= calendar.break_starts_nanos[session_idx])
+            & (nanos < calendar.break_ends_nanos[session_idx])
+        )
+        is_open &= ~in_break
+    
+    return np.asarray(is_open, dtype=bool)
+
+
+def _is_market_open_basic_array(timestamps: pd.DatetimeIndex, info: _ExchInfo) -> np.ndarray:
+    """
+    Array counterpart of _is_market_open_basic.
+    
+    Args:
+        timestamps: Timezone-aware timestamps
+        info: Resolved market configuration
+        
+    Returns:
+        np.ndarray: Boolean mask of timestamps within basic market hours
+    """
+    local = timestamps.tz_convert(info.tz).tz_localize(None).as_unit("ns")
+    time_of_day = np.asarray(local.asi8 - local.normalize().asi8)
+    open_t, close_t = info.open_t, info.close_t
+    open_ns: int = pd.Timedelta(hours=open_t.hour, minutes=open_t.minute).value
+    close_ns: int = pd.Timedelta(hours=close_t.hour, minutes=close_t.minute).value
+    
+    return (
+        (np.asarray(local.dayofweek) < 5)
+        & (time_of_day >= open_ns)
+        & (time_of_day <= close_ns)
+    )
 
 
 def get_market_timezone(exchange: str = "SMART") -> str:
@@ -300,11 +563,14 @@ def get_market_timezone(exchange: str = "SMART") -> str:
     Returns:
         str: Timezone string
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
-    return config["timezone"]
+    info = _resolve(exchange)
+    return info.timezone
 
 
-def is_trading_day(date: pd.Timestamp, exchange: str = "SMART") -> bool:
+def is_trading_day(
+    date: Union[pd.Timestamp, pd.DatetimeIndex, pd.Series, np.ndarray],
+    exchange: str = "SMART"
+) -> Union[bool, np.ndarray]:
     """
     Check if a date is a trading day for a given exchange.
     
@@ -312,31 +578,73 @@ def is_trading_day(date: pd.Timestamp, exchange: str = "SMART") -> bool:
     is available, otherwise just checks weekends.
     
     Args:
-        date: Date to check (timezone-naive)
+        date: Date to check (timezone-naive). A DatetimeIndex, Series or
+            datetime64 array is handed to is_trading_day_array.
         exchange: Exchange to check
         
     Returns:
-        bool: True if it's a trading day
+        Union[bool, np.ndarray]: True if it's a trading day; a boolean mask
+        (np.ndarray) for array-like input
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    if isinstance(date, (pd.Index, pd.Series, np.ndarray)):
+        return is_trading_day_array(date, exchange)
+    
+    info = _resolve(exchange)
     
     # Ensure date is timezone-naive for exchange_calendars
     if date.tz is not None:
         date = date.tz_localize(None)
     
     # Try to use exchange_calendars for accurate trading day check
-    if HAS_EXCHANGE_CALENDARS and "calendar_code" in config:
+    if info.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(info.calendar_code)
             return calendar.is_session(date)
         except Exception as e:
-            logger.debug(f"exchange_calendars failed for {exchange}: {e}, falling back to basic check")
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
     
     # Fallback to basic weekend check
     return date.weekday() < 5
 
 
+def is_trading_day_array(
+    dates: Union[pd.DatetimeIndex, pd.Series, np.ndarray],
+    exchange: str = "SMART"
+) -> np.ndarray:
+    """
+    Vectorized is_trading_day for many dates at once.
+    
+    Fetches the sessions spanning the dates once and tests membership in a
+    single isin call.
+    
+    Args:
+        dates: Dates to check; any time of day is ignored
+        exchange: Exchange to check
+        
+    Returns:
+        np.ndarray: Boolean mask, True where the date is a trading day
+    """
+    info = _resolve(exchange)
+    
+    dates = pd.DatetimeIndex(dates)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    dates = dates.normalize()
+    if len(dates) == 0:
+        return np.zeros(0, dtype=bool)
+    
+    if info.has_advanced:
+        try:
+            calendar = _get_cached_calendar(info.calendar_code)
+            sessions = calendar.sessions_in_range(dates.min(), dates.max())
+            return np.asarray(dates.isin(sessions), dtype=bool)
+        except Exception as e:
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
+    
+    # Fallback to basic weekend check
+    return np.asarray(dates.dayofweek) < 5
+
+
 def get_next_trading_day(date: pd.Timestamp, exchange: str = "SMART") -> pd.Timestamp:
     """
     Get the next trading day for a given exchange.
@@ -348,20 +656,19 @@ def get_next_trading_day(date: pd.Timestamp, exchange: str = "SMART") -> pd.Time
     Returns:
         pd.Timestamp: Next trading day
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    info = _resolve(exchange)
     
     # Ensure date is timezone-naive for exchange_calendars
     if date.tz is not None:
         date = date.tz_localize(None)
     
     # Try to use exchange_calendars for accurate next trading day
-    if HAS_EXCHANGE_CALENDARS and "calendar_code" in config:
+    if info.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(info.calendar_code)
             return calendar.next_session(date)
         except Exception as e:
-            logger.debug(f"exchange_calendars failed for {exchange}: {e}, falling back to basic check")
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
     
     # Fallback to basic next weekday logic
     next_day = date + pd.Timedelta(days=1)
@@ -382,7 +689,7 @@ def get_market_hours(date: pd.Timestamp, exchange: str = "SMART") -> Optional[Tu
         Optional[Tuple[pd.Timestamp, pd.Timestamp]]: (open_time, close_time) in UTC,
         or None if market is closed that day
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    info = _resolve(exchange)
     
     # Ensure date is timezone-naive
     if date.tz is not None:
@@ -393,26 +700,27 @@ def get_market_hours(date: pd.Timestamp, exchange: str = "SMART") -> Optional[Tu
         return None
     
     # Try to use exchange_calendars for accurate market hours
-    if HAS_EXCHANGE_CALENDARS and "calendar_code" in config:
+    if info.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(info.calendar_code)
             
             if calendar.is_session(date):
                 open_time = calendar.session_open(date)
                 close_time = calendar.session_close(date)
                 return (open_time, close_time)
         except Exception as e:
-            logger.debug(f"exchange_calendars failed for {exchange}: {e}, falling back to basic check")
+            logger.debug("exchange_calendars failed for %s: %s, falling back to basic check", exchange, e)
     
     # Fallback to basic market hours
-    market_tz = config["timezone"]
-    open_time = pd.Timestamp(f"{date.strftime('%Y-%m-%d')} {config['open']}")
-    close_time = pd.Timestamp(f"{date.strftime('%Y-%m-%d')} {config['close']}")
-    
-    # Localize to market timezone then convert to UTC
-    open_time = open_time.tz_localize(market_tz).tz_convert('UTC')
-    close_time = close_time.tz_localize(market_tz).tz_convert('UTC')
+    # Build in the market timezone from components (no separate tz_localize) then convert to UTC
+    open_time = pd.Timestamp(
+        year=date.year, month=date.month, day=date.day,
+        hour=info.open_t.hour, minute=info.open_t.minute, tz=info.tz
+    ).tz_convert('UTC')
+    close_time = pd.Timestamp(
+        year=date.year, month=date.month, day=date.day,
+        hour=info.close_t.hour, minute=info.close_t.minute, tz=info.tz
+    ).tz_convert('UTC')
     
     return (open_time, close_time)
 
@@ -428,24 +736,23 @@ def is_market_holiday(date: pd.Timestamp, exchange: str = "SMART") -> bool:
     Returns:
         bool: True if it's a holiday, False otherwise or if unable to determine
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    info = _resolve(exchange)
     
     # Ensure date is timezone-naive
     if date.tz is not None:
         date = date.tz_localize(None)
     
     # Only works with exchange_calendars
-    if HAS_EXCHANGE_CALENDARS and "calendar_code" in config:
+    if info.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(info.calendar_code)
             
             # A day is a holiday if it's a weekday but not a trading session
             if date.weekday() < 5:  # Monday-Friday
                 return not calendar.is_session(date)
             
         except Exception as e:
-            logger.debug(f"exchange_calendars failed for {exchange}: {e}")
+            logger.debug("exchange_calendars failed for %s: %s", exchange, e)
     
     # Can't determine holidays without exchange_calendars
     return False
@@ -475,8 +782,8 @@ def has_advanced_calendar_support(exchange: str = "SMART") -> bool:
     Returns:
         bool: True if advanced calendar support is available
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
-    return HAS_EXCHANGE_CALENDARS and "calendar_code" in config
+    info = _resolve(exchange)
+    return info.has_advanced
 
 
 def get_calendar_info(exchange: str = "SMART") -> dict:
@@ -489,24 +796,23 @@ def get_calendar_info(exchange: str = "SMART") -> dict:
     Returns:
         dict: Calendar information
     """
-    config = MARKET_CONFIGS.get(exchange, MARKET_CONFIGS["SMART"])
+    exch = _resolve(exchange)
     info = {
         "exchange": exchange,
-        "timezone": config["timezone"],
-        "basic_open": config["open"],
-        "basic_close": config["close"],
-        "has_advanced_calendar": has_advanced_calendar_support(exchange),
-        "calendar_code": config.get("calendar_code", "N/A")
+        "timezone": exch.timezone,
+        "basic_open": exch.open,
+        "basic_close": exch.close,
+        "has_advanced_calendar": exch.has_advanced,
+        "calendar_code": exch.calendar_code or "N/A"
     }
     
-    if has_advanced_calendar_support(exchange):
+    if exch.has_advanced:
         try:
-            from exchange_calendars import get_calendar
-            calendar = get_calendar(config["calendar_code"])
+            calendar = _get_cached_calendar(exch.calendar_code)
             info["calendar_name"] = calendar.name
             info["calendar_tz"] = str(calendar.tz)
         except Exception as e:
-            logger.debug(f"Could not get calendar info for {exchange}: {e}")
+            logger.debug("Could not get calendar info for %s: %s", exchange, e)
     
     return info
 
@@ -515,6 +821,7 @@ def get_calendar_info(exchange: str = "SMART") -> dict:
 # Data Freshness and Bar Utilities
 # ============================================================================
 
+@functools.lru_cache(maxsize=64)
 def get_freshness_threshold(bar_size: str) -> timedelta:
     """
     Get the time threshold for considering data fresh enough based on bar size.
@@ -556,6 +863,10 @@ def get_freshness_threshold(bar_size: str) -> timedelta:
         return timedelta(minutes=15)  # Default
 
 
+# Freshness tolerance while the market is closed
+_CLOSED_MARKET_FRESHNESS = timedelta(hours=12)
+
+
 def is_data_fresh_enough(
     data_timestamp: pd.Timestamp, 
     current_time: pd.Timestamp,
@@ -577,15 +888,21 @@ def is_data_fresh_enough(
         bool: True if data is fresh enough
     """
     time_since_data = current_time - data_timestamp
-    market_open = is_market_open(current_time, exchange)
+    threshold = get_freshness_threshold(bar_size)
+    
+    # Within both thresholds is fresh, and beyond both is stale, whatever the
+    # market state, so the calendar lookup is only needed in between
+    if time_since_data <= threshold and time_since_data <= _CLOSED_MARKET_FRESHNESS:
+        return True
+    if time_since_data > threshold and time_since_data > _CLOSED_MARKET_FRESHNESS:
+        return False
     
-    if market_open:
+    if is_market_open(current_time, exchange):
         # Market is open - need fresh data
-        threshold = get_freshness_threshold(bar_size)
         return time_since_data <= threshold
     else:
         # Market is closed - more lenient (up to 12 hours)
-        return time_since_data <= timedelta(hours=12)
+        return time_since_data <= _CLOSED_MARKET_FRESHNESS
 
 
 def get_data_sufficiency_threshold(duration: str) -> pd.Timedelta:
@@ -628,6 +945,21 @@ def get_data_sufficiency_threshold(duration: str) -> pd.Timedelta:
 # Private Helper Functions
 # ============================================================================
 
+# Normalized IBKR bar size -> pandas frequency for the common sizes
+_BAR_FREQ = {
+    "1 min": "1min",
+    "5 mins": "5min",
+    "15 mins": "15min",
+    "30 mins": "30min",
+    "1 hour": "1h",  # Use lowercase 'h' to avoid deprecation warning
+    "1 day": "1D",
+}
+
+# Other "N min(s)" / "N hour(s)" / "N day(s)" forms
+_BAR_SIZE_PATTERN = re.compile(r'^(\d+)\s*(min|hour|day)s?$')
+
+
+@functools.lru_cache(maxsize=64)
 def _parse_bar_size_to_freq(bar_size: str) -> str:
     """
     Convert bar size string to pandas frequency string.
@@ -640,18 +972,16 @@ def _parse_bar_size_to_freq(bar_size: str) -> str:
     """
     bar_size_lower = bar_size.lower().strip()
     
-    # Parse more carefully to avoid conflicts
-    if "1 min" in bar_size_lower and "15 min" not in bar_size_lower:
-        return "1min"
-    elif "5 min" in bar_size_lower and "15 min" not in bar_size_lower:
-        return "5min"
-    elif "15 min" in bar_size_lower:
-        return "15min"
-    elif "30 min" in bar_size_lower:
-        return "30min"
-    elif "hour" in bar_size_lower:
-        return "1h"  # Use lowercase 'h' to avoid deprecation warning
-    elif "day" in bar_size_lower:
-        return "1D"
-    else:
-        return "5min"  # Default
+    freq = _BAR_FREQ.get(bar_size_lower)
+    if freq is not None:
+        return freq
+    
+    match = _BAR_SIZE_PATTERN.match(bar_size_lower)
+    if match:
+        amount, unit = match.groups()
+        if unit == "min":
+            return f"{int(amount)}min"
+        # Multi-hour and multi-day bars align to the hour / day
+        return "1h" if unit == "hour" else "1D"
+    
+    return "5min"  # Default
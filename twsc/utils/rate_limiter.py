@@ -0,0 +1,53 @@
+"""
+Request pacing for the IBKR API.
+
+IBKR rejects historical data requests that arrive too quickly (pacing
+violations, e.g. more than 6 requests for the same contract within 2 seconds).
+This module provides a small asyncio token bucket used to pace bulk requests.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``rate`` acquisitions per ``per`` seconds.
+
+    Bursts of up to ``rate`` requests go through immediately; after that,
+    callers are released at a steady ``rate / per`` requests per second.
+    """
+
+    def __init__(self, rate: int = 6, per: float = 2.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Number of requests allowed per window (bucket size)
+            per: Window length in seconds
+        """
+        if rate < 1 or per <= 0:
+            raise ValueError("rate must be >= 1 and per must be > 0")
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # One waiter at a time keeps the release order FIFO
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) * self.per / self.rate
+                logger.debug("Rate limit reached, waiting %.2fs", delay)
+                await asyncio.sleep(delay)
@@ -1,5 +1,6 @@
-from .nasdaq import get_nasdaq_stocks_list
+from .nasdaq import get_nasdaq_stocks_list, get_nasdaq_stocks_list_async
 
 __all__ = [
     "get_nasdaq_stocks_list",
+    "get_nasdaq_stocks_list_async",
 ]
\ No newline at end of file
@@ -1,10 +1,62 @@
+import atexit
+import functools
 import httpx
+import importlib.util
 import logging
+import time
+from typing import Optional, Tuple
 
 import pandas as pd
 
+# Optional HTTP/2 support (httpx needs the h2 package for it); only probed, never imported here
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+# Optional orjson for faster payload decoding
+try:
+    import orjson  # type: ignore[import-not-found]
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Screener row fields kept in the returned DataFrame
+_SCREENER_COLUMNS = ["symbol", "lastsale", "netchange", "pctchange", "marketCap", "volume", "sector", "industry"]
+
+# Set headers to mimic a browser request
+# old user-agent might cause timeout, so use a more recent one https://www.whatismybrowser.com/detect/what-http-headers-is-my-browser-sending/
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+}
+_TIMEOUT = httpx.Timeout(10.0)
+
+_SCREENER_URL = "https://api.nasdaq.com/api/screener/stocks"
+
+# Seconds a cached screener result is reused before the API is queried again
+_CACHE_TTL = 300
+
+# Shared client so repeated screener calls reuse the pooled connection
+_CLIENT: Optional[httpx.Client] = None
+
+
+def _get_client() -> httpx.Client:
+    """
+    Get the shared screener HTTP client, creating it on first use.
+    
+    Returns:
+        httpx.Client: Keep-alive client (HTTP/2 when h2 is installed)
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(
+            http2=HAS_H2,
+            headers=_HEADERS,
+            timeout=_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
 # Get list of strong buy/sell stocks from API
 """
 https://api.nasdaq.com/api/screener/stocks?tableonly=false&limit=250&exchange=NASDAQ&exsubcategory=NCM&marketcap=mega|large|mid|small&recommendation=strong_buy|strong_sell
@@ -99,66 +151,148 @@ https://api.nasdaq.com/api/screener/stocks?tableonly=false&limit=250&exchange=NA
 }
 """
 
+def _build_screener_params(
+    exchange: list,
+    exsubcategory: list,
+    marketcap: list,
+    recommendation: list,
+    limit: int
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the NASDAQ screener query parameters, as a hashable tuple, for the given filters."""
+    params = {
+        "tableonly": "false",
+        "limit": str(limit) if limit else "",
+        "exchange": "|".join(exchange or ()),
+        "exsubcategory": "|".join(exsubcategory or ()),
+        "marketcap": "|".join(marketcap or ()),
+        "recommendation": "|".join(recommendation or ()),
+        "download": "true",  # To get the full data including headers and rows
+    }
+    return tuple((key, value) for key, value in params.items() if value)
+
+
+def _screener_response_to_frame(response: httpx.Response) -> pd.DataFrame:
+    """Convert a screener response (download=true) to the stock list DataFrame."""
+    response.raise_for_status()
+
+    # orjson decodes the raw bytes directly; response.json() goes through stdlib json
+    data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+    rows = data['data']['rows']
+    '''
+        Example row structure download=true:
+            "symbol": "ABL",
+            "name": "Abacus Global Management Inc. Class A Common Stock",
+            "lastsale": "$5.20",
+            "netchange": "0.00",
+            "pctchange": "0.00%",
+            "volume": "587836",
+            "marketCap": "503635803.00",
+            "country": "United States",
+            "ipoyear": "2020",
+            "industry": "Investment Managers",
+            "sector": "Finance",
+            "url": "/market-activity/stocks/abl"
+    '''
+    # Only the needed columns are materialized from the row dicts
+    df = pd.DataFrame.from_records(rows, columns=_SCREENER_COLUMNS)
+    # One literal (non-regex) strip per column before the numeric parse
+    cleaned = {
+        'lastsale': df['lastsale'].str.replace('$', '', regex=False),
+        'netchange': df['netchange'].str.replace('$', '', regex=False),
+        'pctchange': df['pctchange'].str.rstrip('%'),
+        'volume': df['volume'].str.replace(',', '', regex=False),
+        'marketCap': df['marketCap'].str.replace(',', '', regex=False),
+    }
+    for column, text in cleaned.items():
+        # Malformed values become NaN instead of failing the whole list; blanks are just missing
+        values = pd.to_numeric(text, errors='coerce')
+        coerced = int((values.isna() & text.notna() & (text.str.strip() != '')).sum())
+        if coerced:
+            logger.warning("Coerced %s malformed %s value(s) to NaN", coerced, column)
+        df[column] = values
+    df['pctchange'] = df['pctchange'] / 100.0
+    # Nullable integer, so the dtype is the same whether or not any volume is missing
+    df['volume'] = df['volume'].astype('Int64')
+
+    return df
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_screener(params: Tuple[Tuple[str, str], ...], time_bucket: int = 0) -> pd.DataFrame:
+    """
+    Fetch and parse one screener query; failures raise and are not cached.
+
+    ``time_bucket`` is only part of the cache key: a new bucket every
+    _CACHE_TTL seconds makes live quotes expire.
+    """
+    response = _get_client().get(_SCREENER_URL, params=params)
+    return _screener_response_to_frame(response)
+
+
 def get_nasdaq_stocks_list(
     exchange: list = ["NASDAQ"],
     exsubcategory: list = ["NCM"],  # NCM for NASDAQ
     marketcap: list = ["mega","large","mid","small"],
     recommendation: list = ["strong_buy","strong_sell"],
-    limit: int = 250
+    limit: int = 250,
+    use_cache: bool = True
     
 ):
     """
     Fetch strong buy/sell stocks from NASDAQ screener API.
+    
+    Results are cached for up to _CACHE_TTL seconds per filter combination;
+    pass ``use_cache=False`` to always query the API.
     Returns:
         pd.DataFrame: DataFrame containing stock information
     """
-    screener_url = "https://api.nasdaq.com/api/screener/stocks?tableonly=false"
-    screener_url += f"&limit={limit}" if limit else ""
-    screener_url += f"&exchange={'|'.join(exchange)}" if exchange else ""
-    screener_url += f"&exsubcategory={'|'.join(exsubcategory)}" if exsubcategory else ""
-    screener_url += f"&marketcap={'|'.join(marketcap)}" if marketcap else ""
-    screener_url += f"&recommendation={'|'.join(recommendation)}" if recommendation else ""
-    screener_url += "&download=true"  # To get the full data including headers and rows
-    
-    # Set headers to mimic a browser request
-    # old user-agent might cause timeout, so use a more recent one https://www.whatismybrowser.com/detect/what-http-headers-is-my-browser-sending/
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
-    }
+    params = _build_screener_params(exchange, exsubcategory, marketcap, recommendation, limit)
 
     try:
-        response = httpx.get(screener_url, headers=headers)
-        response.raise_for_status()
+        if use_cache:
+            # Copy so callers can't modify the cached frame
+            return _fetch_screener(params, int(time.time() // _CACHE_TTL)).copy()
+        return _fetch_screener.__wrapped__(params)
+    except httpx.RequestError as e:
+        logger.error(f"Request error: {e}")
+        return pd.DataFrame()
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
+        return pd.DataFrame()
 
-        data = response.json()
-        rows = data['data']['rows']
-        '''
-            Example row structure download=true:
-                "symbol": "ABL",
-                "name": "Abacus Global Management Inc. Class A Common Stock",
-                "lastsale": "$5.20",
-                "netchange": "0.00",
-                "pctchange": "0.00%",
-                "volume": "587836",
-                "marketCap": "503635803.00",
-                "country": "United States",
-                "ipoyear": "2020",
-                "industry": "Investment Managers",
-                "sector": "Finance",
-                "url": "/market-activity/stocks/abl"
-        '''
-        df = pd.DataFrame(rows)
-        df = df[["symbol", "lastsale", "netchange", "pctchange", "marketCap", "volume", "sector", "industry"]]
-        df['lastsale'] = df['lastsale'].str.replace('$', '').astype(float)
-        df['netchange'] = df['netchange'].str.replace('$', '').astype(float)
-        df['pctchange'] = df['pctchange'].str.replace('%', '').astype(float) / 100.0
-        df['volume'] = df['volume'].str.replace(',', '').astype(int)
-        df['marketCap'] = df['marketCap'].str.replace(',', '').astype(float)
-
-        return df
+
+async def get_nasdaq_stocks_list_async(
+    exchange: list = ["NASDAQ"],
+    exsubcategory: list = ["NCM"],  # NCM for NASDAQ
+    marketcap: list = ["mega","large","mid","small"],
+    recommendation: list = ["strong_buy","strong_sell"],
+    limit: int = 250,
+    client: Optional[httpx.AsyncClient] = None
+):
+    """
+    Async version of get_nasdaq_stocks_list.
+    
+    Pass one shared ``client`` to fan out several screener queries with
+    asyncio.gather over the same connection pool.
+    
+    Args:
+        client: AsyncClient to send the request with. A temporary one is
+            created for the call if omitted.
+    Returns:
+        pd.DataFrame: DataFrame containing stock information
+    """
+    params = _build_screener_params(exchange, exsubcategory, marketcap, recommendation, limit)
+
+    try:
+        if client is None:
+            async with httpx.AsyncClient(http2=HAS_H2, headers=_HEADERS, timeout=_TIMEOUT) as own_client:
+                response = await own_client.get(_SCREENER_URL, params=params)
+        else:
+            response = await client.get(_SCREENER_URL, params=params, headers=_HEADERS)
+        return _screener_response_to_frame(response)
     except httpx.RequestError as e:
         logger.error(f"Request error: {e}")
         return pd.DataFrame()
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()